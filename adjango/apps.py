@@ -7,3 +7,11 @@ class ADjangoConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'adjango'
     verbose_name = _('ADjango')
+
+    def ready(self):
+        from adjango.conf import ADJANGO_GETORN_CACHE_ALIAS
+
+        if ADJANGO_GETORN_CACHE_ALIAS is not None:
+            from adjango.services.cache import connect_cache_invalidation
+
+            connect_cache_invalidation()
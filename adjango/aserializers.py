@@ -1,20 +1,43 @@
 # aserializers.py
-from typing import List, Optional, TypedDict
+import json
+import re
+import sys
+import warnings
+from collections import Counter, defaultdict
+from contextlib import ExitStack, nullcontext
+from contextvars import ContextVar
+from itertools import islice
+from typing import AsyncIterator, ContextManager, List, Optional, TypedDict, Union
 
 try:
     from rest_framework import status
     from rest_framework.exceptions import APIException
+    from rest_framework.fields import BooleanField, CharField, Field, FloatField, IntegerField, SkipField
+    from rest_framework.relations import PKOnlyObject, PrimaryKeyRelatedField
     from rest_framework.serializers import (
         LIST_SERIALIZER_KWARGS,
         LIST_SERIALIZER_KWARGS_REMOVE,
+        BaseSerializer,
+        SerializerMethodField,
+        ValidationError,
+        raise_errors_on_nested_writes,
     )
     from rest_framework.serializers import ListSerializer as DRFListSerializer
     from rest_framework.serializers import ModelSerializer as DRFModelSerializer
     from rest_framework.serializers import Serializer as DRFSerializer
     from rest_framework.status import HTTP_400_BAD_REQUEST
+    from rest_framework.settings import api_settings
+    from rest_framework.utils import model_meta
+    from rest_framework.utils.encoders import JSONEncoder
+    from rest_framework.validators import UniqueValidator
 except ImportError:
     pass
 from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, transaction
+from django.db.models import Model, QuerySet
+from django.db.models.manager import BaseManager
+from django.http import StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
 
 
@@ -23,9 +46,20 @@ class FieldError(TypedDict):
     message: str
 
 
-def serializer_errors_to_field_errors(serializer_errors) -> List[FieldError]:
+def serializer_errors_to_field_errors(serializer_errors, prefix: str = '') -> List[FieldError]:
+    """
+    Flattens serializer errors into field/message pairs. Errors of nested and list
+    serializers ({0: {'name': [...]}} or [{}, {'name': [...]}]) get dotted fields, e.g. '0.name'.
+    """
     field_errors = []
-    for field, messages in serializer_errors.items():
+    items = enumerate(serializer_errors) if isinstance(serializer_errors, list) else serializer_errors.items()
+    for key, messages in items:
+        field = f'{prefix}{key}'
+        if isinstance(messages, str):
+            messages = [messages]
+        if isinstance(messages, dict) or any(isinstance(message, (dict, list)) for message in messages):
+            field_errors.extend(serializer_errors_to_field_errors(messages, f'{field}.'))
+            continue
         for message in messages:
             field_errors.append(FieldError(field=field, message=message))
     return field_errors
@@ -55,7 +89,7 @@ class DetailAPIException(APIException):
 class SerializerErrors(DetailAPIException):
     def __init__(
         self,
-        serializer_errors: dict,
+        serializer_errors: Union[dict, list],
         code: Optional[str] = None,
         status_code: str = HTTP_400_BAD_REQUEST,
         message: str = _('Correct the mistakes.'),
@@ -67,17 +101,390 @@ class SerializerErrors(DetailAPIException):
         super().__init__(detail=detail, code=code, status_code=status_code)
 
 
+class NPlusOneError(Exception):
+    """Raised when serializer repeats the same query more than allowed."""
+
+
+class NPlusOneWarning(RuntimeWarning):
+    """Emitted when serializer repeats the same query more than allowed."""
+
+
+_SQL_IN_LIST = re.compile(r'IN \((?:%s, )*%s\)')
+_SQL_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+# Code objects of to_representation loops keeping the current field in a `field` local
+_FIELD_LOOP_CODES = {DRFSerializer.to_representation.__code__}
+_active_query_detector: ContextVar[Optional['QueryPatternDetector']] = ContextVar(
+    '_active_query_detector', default=None
+)
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Collapses IN lists and literals so queries differing only by values share one pattern.
+    """
+    return _SQL_LITERAL.sub('?', _SQL_IN_LIST.sub('IN (...)', sql))
+
+
+def _serializer_field_path() -> str:
+    """
+    Dotted path of serializer fields being rendered in the current thread,
+    taken from the `field` loop variable of Serializer.to_representation frames.
+    """
+    names = []
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code in _FIELD_LOOP_CODES:
+            field = frame.f_locals.get('field')
+            if field is not None:
+                names.append(field.field_name)
+        frame = frame.f_back
+    return '.'.join(reversed(names))
+
+
+class QueryPatternDetector:
+    """
+    Counts queries by normalized SQL and reports patterns repeated more than threshold times,
+    together with the serializer field that issued them.
+
+    @usage:
+        with QueryPatternDetector(threshold=3, raise_exception=True):
+            data = OrderSerializer(orders, many=True).data
+    """
+
+    def __init__(self, threshold: int, raise_exception: bool = False, label: str = 'Serializer'):
+        self.threshold = threshold
+        self.raise_exception = raise_exception
+        self.label = label
+        self.counts: Counter = Counter()
+        self.fields: defaultdict = defaultdict(Counter)
+        self._stack: Optional[ExitStack] = None
+        self._token = None
+
+    def __call__(self, execute, sql, params, many, context):
+        pattern = normalize_sql(sql)
+        self.counts[pattern] += 1
+        self.fields[pattern][_serializer_field_path()] += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self) -> 'QueryPatternDetector':
+        self._token = _active_query_detector.set(self)
+        self._stack = ExitStack()
+        for alias in connections:
+            self._stack.enter_context(connections[alias].execute_wrapper(self))
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._stack.close()
+        _active_query_detector.reset(self._token)
+        if exc_type is None:
+            self.report()
+        return False
+
+    @property
+    def repeated(self) -> List[tuple]:
+        """(sql, count, field path) for every pattern repeated more than threshold times."""
+        return [
+            (sql, count, self.fields[sql].most_common(1)[0][0])
+            for sql, count in self.counts.most_common()
+            if count > self.threshold
+        ]
+
+    def report(self) -> None:
+        repeated = self.repeated
+        if not repeated:
+            return
+        message = '\n'.join(
+            f'{self.label}: query repeated {count} times by field \'{field or "<root>"}\': {sql}'
+            for sql, count, field in repeated
+        )
+        if self.raise_exception:
+            raise NPlusOneError(message)
+        warnings.warn(message, NPlusOneWarning, stacklevel=4)
+
+
+def query_check(label: str) -> ContextManager:
+    """
+    QueryPatternDetector configured by ADJANGO_SERIALIZER_QUERY_THRESHOLD/RAISE settings,
+    or no-op context if the check is disabled or already running.
+    """
+    from adjango.conf import ADJANGO_SERIALIZER_QUERY_RAISE, ADJANGO_SERIALIZER_QUERY_THRESHOLD
+
+    if ADJANGO_SERIALIZER_QUERY_THRESHOLD is None or _active_query_detector.get() is not None:
+        return nullcontext()
+    return QueryPatternDetector(
+        threshold=ADJANGO_SERIALIZER_QUERY_THRESHOLD,
+        raise_exception=ADJANGO_SERIALIZER_QUERY_RAISE,
+        label=label,
+    )
+
+
+# Output types for which field.to_representation(value) is value itself
+_IDENTITY_OUTPUT_TYPES = {
+    CharField.to_representation: (str,),
+    IntegerField.to_representation: (int,),
+    BooleanField.to_representation: (bool,),
+    FloatField.to_representation: (float,),
+}
+
+
+def _is_plain_field(field, model) -> bool:
+    """
+    Whether field can be rendered by the compiled plan: DRF fields, method fields and nested
+    serializers, read from a model attribute (no source='*' or method source).
+    """
+    if isinstance(field, SerializerMethodField):
+        return True
+    if field.source == '*':
+        return False
+    if field.source_attrs and model is not None and callable(getattr(model, field.source_attrs[0], None)):
+        return False
+    if isinstance(field, BaseSerializer):
+        return True
+    return type(field).to_representation.__module__.startswith('rest_framework.')
+
+
+def _compile_field(field, model) -> tuple:
+    """
+    Plan entry (field_name, attname, identity_types) for compiled to_representation.
+    attname is None for fields rendered the generic way, identity_types is None
+    when the raw attribute value is always the output.
+    """
+    generic = (field.field_name, None, None)
+    if model is None or len(field.source_attrs) != 1:
+        return generic
+    try:
+        model_field = model._meta.get_field(field.source_attrs[0])
+    except FieldDoesNotExist:
+        return generic
+    if not model_field.concrete:
+        return generic
+    if model_field.is_relation:
+        if type(field) is PrimaryKeyRelatedField and field.pk_field is None:
+            return field.field_name, model_field.attname, None
+        return generic
+    if type(field).get_attribute is not Field.get_attribute:
+        return generic
+    return field.field_name, model_field.attname, _IDENTITY_OUTPUT_TYPES.get(type(field).to_representation, ())
+
+
 class AListSerializer(DRFListSerializer):
+    @property
+    def data(self):
+        with query_check(f'{self.child.__class__.__name__}(many=True)'):
+            return super().data
+
     @property
     async def adata(self):
-        items_data = []
-        for item in self.instance:
-            # Create serializer for list item
-            serializer = self.child.__class__(item, context=self.context)
-            # Use sync_to_async to get data and avoid awaiting the same coroutine multiple times
-            data = await sync_to_async(lambda: serializer.data)()
-            items_data.append(data)
-        return items_data
+        # Evaluate the queryset and render all items with the shared child serializer
+        # in a single thread hop instead of one sync_to_async call per item
+        return await sync_to_async(lambda: self.data)()
+
+    async def asave(self, **kwargs):
+        return await sync_to_async(self.save)(**kwargs)
+
+    async def ais_valid(self, raise_exception=False, **kwargs):
+        is_valid = await sync_to_async(self.is_valid)(**kwargs)
+        if raise_exception and not is_valid:
+            raise SerializerErrors(self.errors)
+        return is_valid
+
+    @property
+    async def avalid_data(self):
+        return await sync_to_async(lambda: self.validated_data)()
+
+    async def astream(self, chunk_size: int = 2000) -> AsyncIterator[str]:
+        """
+        Async generator yielding the serialized list as JSON array fragments.
+
+        QuerySets are fetched via iterator(chunk_size=...), and every chunk is
+        serialized and encoded in one thread hop, so memory stays flat
+        regardless of the number of rows.
+
+        :param chunk_size: Number of rows fetched and serialized per thread hop.
+
+        @usage: async for fragment in ProductSerializer(Product.objects.all(), many=True).astream(): ...
+        """
+        instance = self.instance
+        if isinstance(instance, BaseManager):
+            instance = instance.all()
+        if isinstance(instance, QuerySet):
+            rows = instance.iterator(chunk_size=chunk_size)
+        else:
+            rows = iter(instance if instance is not None else ())
+
+        def render_chunk() -> Optional[str]:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return None
+            return ','.join(
+                json.dumps(
+                    self.child.to_representation(item),
+                    cls=JSONEncoder,
+                    ensure_ascii=False,
+                    separators=(',', ':'),
+                )
+                for item in chunk
+            )
+
+        yield '['
+        try:
+            first = True
+            while True:
+                fragment = await sync_to_async(render_chunk)()
+                if fragment is None:
+                    break
+                yield fragment if first else ',' + fragment
+                first = False
+        finally:
+            # Release the server-side cursor if the consumer stopped early
+            close = getattr(rows, 'close', None)
+            if close is not None:
+                await sync_to_async(close)()
+        yield ']'
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    Streams AListSerializer output as a JSON array without materializing the whole list.
+
+    @usage: return StreamingJSONResponse(ProductSerializer(Product.objects.all(), many=True))
+    """
+
+    def __init__(self, serializer: AListSerializer, chunk_size: int = 2000, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(serializer.astream(chunk_size=chunk_size), **kwargs)
+
+
+class ABulkListSerializer(AListSerializer):
+    """
+    List serializer persisting all items with bulk_create/bulk_update in one transaction.
+
+    Unique field checks run as one IN query per field for the whole list (also catching
+    duplicates inside the payload) instead of one query per item. Found values are matched
+    to items by Python equality, so collisions only the database sees as equal (case-insensitive
+    collations, constraints on lower(...)) are not reported as field errors; they raise
+    IntegrityError on save and the transaction is rolled back. On update, instance
+    items are matched to data items by position. Note that bulk operations don't call
+    Model.save() and don't send pre_save/post_save signals.
+
+    @usage:
+        serializer = OrderSerializer(data=payload, many=True, bulk=True)
+        await serializer.ais_valid(raise_exception=True)
+        orders = await serializer.asave()
+    """
+
+    def _bulk_instances(self) -> Optional[list]:
+        if self.instance is None:
+            return None
+        if not isinstance(self.instance, list):
+            self.instance = list(self.instance)
+        return self.instance
+
+    def _pop_unique_validators(self) -> list:
+        """Moves exact UniqueValidators off child fields, so they are checked in batch."""
+        if not hasattr(self, '_unique_checks'):
+            self._unique_checks = []
+            for field in self.child.fields.values():
+                if field.read_only:
+                    continue
+                batched = [v for v in field.validators if isinstance(v, UniqueValidator) and v.lookup == 'exact']
+                if batched:
+                    field.validators = [v for v in field.validators if v not in batched]
+                    self._unique_checks.extend((field, validator) for validator in batched)
+        return self._unique_checks
+
+    def run_child_validation(self, data):
+        instances = getattr(self, '_child_instances', None)
+        if instances is not None:
+            self.child.instance = next(instances)
+        return super().run_child_validation(data)
+
+    def to_internal_value(self, data):
+        unique_checks = self._pop_unique_validators()
+        instances = self._bulk_instances()
+        if instances is not None:
+            if isinstance(data, list) and len(data) != len(instances):
+                raise ValidationError(
+                    {api_settings.NON_FIELD_ERRORS_KEY: [_('Expected %d items.') % len(instances)]},
+                    code='invalid',
+                )
+            self._child_instances = iter(instances)
+        try:
+            ret = super().to_internal_value(data)
+        finally:
+            self._child_instances = None
+            self.child.instance = None
+        self._validate_unique_batch(ret, unique_checks, instances)
+        return ret
+
+    @staticmethod
+    def _validate_unique_batch(ret: list, unique_checks: list, instances: Optional[list]) -> None:
+        errors = {}
+        for field, validator in unique_checks:
+            source = field.source_attrs[-1]
+            values = [attrs[source] for attrs in ret if source in attrs]
+            if not values:
+                continue
+            taken = defaultdict(set)
+            for pk, value in validator.queryset.filter(**{f'{source}__in': values}).values_list('pk', source):
+                taken[value].add(pk)
+            seen = set()
+            for index, attrs in enumerate(ret):
+                if source not in attrs:
+                    continue
+                value = attrs[source]
+                own_pk = instances[index].pk if instances is not None else None
+                if taken[value] - {own_pk} or value in seen:
+                    errors.setdefault(index, {}).setdefault(field.field_name, []).append(
+                        ValidationError(validator.message, code='unique').detail[0]
+                    )
+                seen.add(value)
+
+        if errors:
+            if getattr(api_settings, 'LIST_SERIALIZER_ERRORS_AS_DICT', False):
+                raise ValidationError(errors)
+            raise ValidationError([errors.get(index, {}) for index in range(len(ret))])
+
+    def _split_many_to_many(self, validated_data: list) -> tuple:
+        model = self.child.Meta.model
+        info = model_meta.get_field_info(model)
+        many_to_many = [name for name, relation in info.relations.items() if relation.to_many]
+        items, relations = [], []
+        for attrs in validated_data:
+            raise_errors_on_nested_writes('create', self.child, attrs)
+            attrs = dict(attrs)
+            relations.append({name: attrs.pop(name) for name in many_to_many if name in attrs})
+            items.append(attrs)
+        return model, items, relations
+
+    @staticmethod
+    def _set_many_to_many(instances: list, relations: list) -> None:
+        for instance, fields in zip(instances, relations):
+            for name, value in fields.items():
+                getattr(instance, name).set(value)
+
+    def create(self, validated_data):
+        model, items, relations = self._split_many_to_many(validated_data)
+        instances = model._default_manager.bulk_create([model(**attrs) for attrs in items])
+        self._set_many_to_many(instances, relations)
+        return instances
+
+    def update(self, instance, validated_data):
+        model, items, relations = self._split_many_to_many(validated_data)
+        instances = self._bulk_instances()
+        update_fields = set()
+        for obj, attrs in zip(instances, items):
+            for attr, value in attrs.items():
+                setattr(obj, attr, value)
+            update_fields.update(attrs)
+        if update_fields:
+            model._default_manager.bulk_update(instances, sorted(update_fields))
+        self._set_many_to_many(instances, relations)
+        return instances
+
+    def save(self, **kwargs):
+        with transaction.atomic():
+            return super().save(**kwargs)
 
 
 class ASerializer(DRFSerializer):
@@ -120,6 +527,64 @@ class AModelSerializer(DRFModelSerializer):
             raise SerializerErrors(self.errors)
         return is_valid
 
+    @property
+    def data(self):
+        with query_check(self.__class__.__name__):
+            return super().data
+
+    def to_representation(self, instance):
+        compiled = self._compiled_fields()
+        if compiled is None or not isinstance(instance, Model):
+            # Plain objects (e.g. validated_data dicts) have no attnames
+            return super().to_representation(instance)
+
+        ret = {}
+        for name, attname, identity_types, field in compiled:
+            if attname is None:
+                # Generic DRF path for nested, method and custom fields
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                ret[name] = None if check_for_none is None else field.to_representation(attribute)
+                continue
+            value = getattr(instance, attname)
+            if value is None or identity_types is None or type(value) in identity_types:
+                ret[name] = value
+            else:
+                ret[name] = field.to_representation(value)
+        return ret
+
+    def _compiled_fields(self) -> Optional[tuple]:
+        """
+        Precomputed (field_name, attname, identity_types, field) rows for Meta.compiled = True.
+        The plan is built once per class from the first instance; plain model columns and
+        primary key relations are then read with a single getattr per row. None (generic DRF path)
+        if any field has its own to_representation, source='*' or a method source.
+        """
+        if not getattr(getattr(self, 'Meta', None), 'compiled', False):
+            return None
+        compiled = getattr(self, '_compiled', None)
+        if compiled is None:
+            readable = list(self._readable_fields)
+            model = getattr(self.Meta, 'model', None)
+            if not all(_is_plain_field(field, model) for field in readable):
+                # Custom field logic is only honoured by the generic DRF path
+                self._compiled = False
+                return None
+            names = tuple(field.field_name for field in readable)
+            cls = self.__class__
+            plan = cls.__dict__.get('_compiled_plan')
+            if plan is None or tuple(entry[0] for entry in plan) != names:
+                plan = tuple(_compile_field(field, model) for field in readable)
+                # Fields may depend on instance arguments, cache only the first plan per class
+                if '_compiled_plan' not in cls.__dict__:
+                    cls._compiled_plan = plan
+            compiled = tuple(entry + (field,) for entry, field in zip(plan, readable))
+            self._compiled = compiled
+        return compiled or None
+
     @property
     async def adata(self):
         return await sync_to_async(lambda: self.data)()
@@ -133,6 +598,9 @@ class AModelSerializer(DRFModelSerializer):
         # Prepare arguments for ListSerializer and child serializer
         list_kwargs = {}
 
+        # bulk=True switches to bulk_create/bulk_update persistence
+        bulk = kwargs.pop('bulk', False)
+
         # Parameters that should go to ListSerializer (e.g., allow_empty)
         list_serializer_kwargs = {key: value for key, value in kwargs.items() if key in LIST_SERIALIZER_KWARGS}
 
@@ -157,5 +625,10 @@ class AModelSerializer(DRFModelSerializer):
             list_kwargs['data'] = data
 
         meta = getattr(cls, 'Meta', None)
+        if bulk:
+            return ABulkListSerializer(*args, **list_kwargs)
         list_serializer_class = getattr(meta, 'list_serializer_class', AListSerializer)
         return list_serializer_class(*args, **list_kwargs)
+
+
+_FIELD_LOOP_CODES.add(AModelSerializer.to_representation.__code__)
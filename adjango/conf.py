@@ -28,3 +28,10 @@ ADJANGO_IP_LOGGER = get_setting('ADJANGO_IP_LOGGER')
 ADJANGO_IP_META_NAME = get_setting('ADJANGO_IP_META_NAME')
 MEDIA_SUBSTITUTION_URL = get_setting('MEDIA_SUBSTITUTION_URL')
 ADJANGO_BASE_LOGGER = get_setting('ADJANGO_BASE_LOGGER')
+ADJANGO_SERIALIZER_QUERY_THRESHOLD = get_setting('ADJANGO_SERIALIZER_QUERY_THRESHOLD')
+ADJANGO_SERIALIZER_QUERY_RAISE = get_setting('ADJANGO_SERIALIZER_QUERY_RAISE', False)
+ADJANGO_GETORN_CACHE_ALIAS = get_setting('ADJANGO_GETORN_CACHE_ALIAS')
+ADJANGO_FILE_CLEANUP_EXECUTOR = get_setting('ADJANGO_FILE_CLEANUP_EXECUTOR', 'inline')
+ADJANGO_FILE_CLEANUP_BATCH_SIZE = get_setting('ADJANGO_FILE_CLEANUP_BATCH_SIZE', 100)
+ADJANGO_FILE_CLEANUP_THREADS = get_setting('ADJANGO_FILE_CLEANUP_THREADS', 4)
+ADJANGO_FILE_CLEANUP_RETRIES = get_setting('ADJANGO_FILE_CLEANUP_RETRIES', 3)
@@ -0,0 +1,168 @@
+# management/commands/sweepmedia.py
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import islice
+from typing import Any, Iterator, Optional
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import FileField
+from django.utils import timezone
+
+from adjango.utils.common import get_models_list
+
+
+def walk_storage(storage: Any, path: str = "", after: Optional[str] = None) -> Iterator[str]:
+    """
+    Streams file names of storage under path in lexicographic order,
+    skipping names and whole directories <= after.
+    """
+    dirs, files = storage.listdir(path)
+    prefix = f"{path}/" if path else ""
+    # Directories sort as "name/", so full names come out in lexicographic order
+    entries = sorted([(f"{prefix}{name}/", True) for name in dirs] + [(f"{prefix}{name}", False) for name in files])
+    for name, is_dir in entries:
+        if after is not None and name <= after and not (is_dir and after.startswith(name)):
+            continue
+        if is_dir:
+            yield from walk_storage(storage, name[:-1], after)
+        else:
+            yield name
+
+
+def storage_key(storage: Any) -> tuple:
+    """
+    Identity of the files behind storage: class plus location/bucket settings,
+    so separate instances configured the same way are swept once.
+    """
+    cls = storage.__class__
+    config = tuple(getattr(storage, name, None) for name in ("location", "bucket_name", "base_url"))
+    if any(value is not None for value in config):
+        return cls, config
+    # Unknown storage: fall back to its constructor arguments
+    if hasattr(storage, "deconstruct"):
+        _, args, kwargs = storage.deconstruct()
+        return cls, repr(args), repr(sorted(kwargs.items()))
+    return cls, id(storage)
+
+
+class Command(BaseCommand):
+    """
+    Finds files in storages of FileField/ImageField fields of all models which are
+    not referenced by any row and reports or deletes them.
+
+    Usage: python manage.py sweepmedia [--delete] [--state sweep.json] [--prefix uploads]
+    """
+
+    help = "Reports or deletes storage files not referenced by any FileField of any model"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--delete", action="store_true",
+            help="Delete orphaned files instead of only reporting them",
+        )
+        parser.add_argument("--prefix", default="", help="Only walk this storage directory")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Names checked per IN query")
+        parser.add_argument("--workers", type=int, default=8, help="Threads checking/deleting orphaned files")
+        parser.add_argument(
+            "--min-age", type=int, default=3600,
+            help="Skip files modified less than this many seconds ago (uploads not committed yet)",
+        )
+        parser.add_argument("--state", help="JSON file to store progress in and resume from")
+
+    def handle(self, *args: tuple, **options: Any) -> None:
+        if options["batch_size"] < 1 or options["workers"] < 1:
+            raise CommandError("--batch-size and --workers must be positive")
+        self.options = options
+        self.state = self._load_state(options["state"])
+        self.min_modified = timezone.now() - timedelta(seconds=options["min_age"])
+
+        with ThreadPoolExecutor(max_workers=options["workers"]) as self.pool:
+            for key, (storage, fields) in self._storages().items():
+                self._sweep(key, storage, fields)
+
+    def _storages(self) -> dict[str, tuple[Any, list[tuple[Any, FileField]]]]:
+        """Groups file fields of concrete models by storage, keyed by the first field label."""
+        storages: dict[tuple, tuple[Any, list[tuple[Any, FileField]]]] = {}
+        for label in get_models_list():
+            model = apps.get_model(label)
+            if model._meta.proxy:
+                continue
+            for field in model._meta.local_concrete_fields:
+                if isinstance(field, FileField):
+                    _, fields = storages.setdefault(storage_key(field.storage), (field.storage, []))
+                    fields.append((model, field))
+        return {
+            f"{fields[0][0]._meta.label}.{fields[0][1].name}": (storage, fields)
+            for storage, fields in storages.values()
+        }
+
+    def _sweep(self, key: str, storage: Any, fields: list[tuple[Any, FileField]]) -> None:
+        after = self.state.get(key)
+        if after is not None and not after.startswith(self.options["prefix"]):
+            after = None
+        self.stdout.write(f"Sweeping storage of {key}" + (f" from {after}" if after else ""))
+
+        scanned = orphaned = deleted = 0
+        names = walk_storage(storage, self.options["prefix"].strip("/"), after)
+        while batch := self._next_batch(names):
+            referenced: set[str] = set()
+            for model, field in fields:
+                referenced.update(
+                    model._base_manager.filter(**{f"{field.attname}__in": batch})
+                    .values_list(field.attname, flat=True)
+                )
+            orphans = [name for name in batch if name not in referenced]
+            for name, removed in zip(orphans, self.pool.map(lambda n: self._handle_orphan(storage, n), orphans)):
+                if removed is None:
+                    continue
+                orphaned += 1
+                deleted += removed
+                self.stdout.write(f"{'Deleted' if removed else 'Orphaned'}: {name}")
+            scanned += len(batch)
+            self.state[key] = batch[-1]
+            self._save_state()
+
+        self.state.pop(key, None)
+        self._save_state()
+        self.stdout.write(f"{key}: scanned {scanned}, orphaned {orphaned}, deleted {deleted}")
+
+    def _next_batch(self, names: Iterator[str]) -> list[str]:
+        try:
+            return list(islice(names, self.options["batch_size"]))
+        except FileNotFoundError:
+            # Storage has no files under --prefix
+            return []
+
+    def _handle_orphan(self, storage: Any, name: str) -> Optional[bool]:
+        """Returns None for recently modified files, True if deleted, False if only reported/failed."""
+        try:
+            if storage.get_modified_time(name) > self.min_modified:
+                return None
+        except (NotImplementedError, OSError):
+            pass
+        if not self.options["delete"]:
+            return False
+        try:
+            storage.delete(name)
+        except Exception as e:  # noqa
+            self.stderr.write(f"Failed to delete {name}: {e}")
+            return False
+        return True
+
+    @staticmethod
+    def _load_state(path: Optional[str]) -> dict[str, str]:
+        if not path or not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def _save_state(self) -> None:
+        path = self.options["state"]
+        if not path:
+            return
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(self.state, file)
+        os.replace(f"{path}.tmp", path)
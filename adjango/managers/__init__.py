@@ -0,0 +1,9 @@
+from .base import AManager, FileCleanupManager
+
+__all__ = ['AManager', 'FileCleanupManager']
+
+try:
+    from .polymorphic import APolymorphicManager
+    __all__.append('APolymorphicManager')
+except ImportError:
+    pass
@@ -0,0 +1,14 @@
+# managers/base.py
+from __future__ import annotations
+
+from django.db.models import Manager
+
+from adjango.querysets.base import AQuerySet, FileCleanupQuerySet
+
+
+class AManager(Manager.from_queryset(AQuerySet)):  # type: ignore[misc]
+    """Manager exposing AQuerySet async helpers (aall, agetorn, abulk_upsert, aiter_chunks...)."""
+
+
+class FileCleanupManager(Manager.from_queryset(FileCleanupQuerySet)):  # type: ignore[misc]
+    """AManager of FileCleanupMixin models, bulk deletes/updates clean stored files."""
@@ -0,0 +1,14 @@
+# managers/polymorphic.py
+from __future__ import annotations
+
+try:
+    from polymorphic.managers import PolymorphicManager
+
+    from adjango.querysets.polymorphic import APolymorphicQuerySet
+
+    class APolymorphicManager(PolymorphicManager.from_queryset(APolymorphicQuerySet)):  # type: ignore[misc]
+        """PolymorphicManager exposing AQuerySet async helpers and abase_only()."""
+
+except ImportError:
+    # django-polymorphic not installed
+    pass
@@ -2,6 +2,7 @@
 import json
 import logging
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.conf import settings
 
 from adjango.conf import (
@@ -10,6 +11,7 @@ from adjango.conf import (
     ADJANGO_IP_META_NAME,
     MEDIA_SUBSTITUTION_URL,
 )
+from adjango.services.base import IdentityMap
 
 
 class IPAddressMiddleware:
@@ -97,3 +99,29 @@ class MediaDomainSubstitutionJSONMiddleware:
                 return f"{self.media_domain}{data}"
             return data
         return data
+
+
+class IdentityMapMiddleware:
+    """
+    Activates request-scoped IdentityMap, so BaseService.getorn/agetorn
+    return already fetched instances for repeated pk/unique lookups within one request.
+    Works with both sync (WSGI) and async (ASGI) stacks.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with IdentityMap.scope():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with IdentityMap.scope():
+            return await self.get_response(request)
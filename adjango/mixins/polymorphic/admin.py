@@ -1,15 +1,24 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
 
+from adjango.utils.contenttypes import get_ctype_verbose_name, warm_ctype_cache
+
 
 class PolymorphicTypeAdminMixin:
     def type(self, obj):
-        if obj.polymorphic_ctype:
-            return obj.polymorphic_ctype.name
+        if obj.polymorphic_ctype_id:
+            # Process-wide ctype table, no query per changelist row
+            return get_ctype_verbose_name(obj.polymorphic_ctype_id, obj._state.db)
         return _('Unknown')
 
     type.short_description = _('Type')
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)  # noqa
+        # Loads all ContentTypes in one query if the table is cold, rows then resolve type from it
+        warm_ctype_cache(queryset.db)
+        return queryset
+
     def get_list_filter(self, request):
         list_filter = super().get_list_filter(request)  # noqa
         return tuple(list_filter) + (('polymorphic_ctype', admin.RelatedOnlyFieldListFilter),)
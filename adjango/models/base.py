@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, Any
 
 from django.db.models import Model as DjangoModel
 
+from adjango.managers.base import AManager
+from adjango.services.base import IdentityMap
 from adjango.utils.funcs import arelated
 
 if TYPE_CHECKING:
@@ -14,9 +16,20 @@ if TYPE_CHECKING:
 class Model(DjangoModel):
     """Base model class with enhanced functionality."""
 
+    objects = AManager()
+
     class Meta:
         abstract = True
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        super().save(*args, **kwargs)
+        IdentityMap.invalidate(self)
+
+    def delete(self, *args: Any, **kwargs: Any) -> Any:
+        # Before super().delete(), which resets pk to None
+        IdentityMap.invalidate(self)
+        return super().delete(*args, **kwargs)
+
     async def arelated(self, field: str) -> Any:
         """
         Get related field value asynchronously.
@@ -1,12 +1,26 @@
 # models/choices.py
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Iterable, Optional
 
-from django.db.models import IntegerChoices, TextChoices
+from django.db.models import Case, CharField, IntegerChoices, TextChoices, Value, When
 
 __all__ = ['AChoicesMixin', 'ATextChoices', 'AIntegerChoices']
 
 
 class AChoicesMixin:
+    @classmethod
+    def _choice_tables(cls: Any) -> tuple[MappingProxyType, frozenset]:
+        """
+        Frozen value-to-label table and value set, computed once per choices class.
+        Labels are kept as is, so lazy translations are still resolved on use.
+        """
+        tables = cls.__dict__.get('_achoices_tables')
+        if tables is None:
+            labels = {member.value: member.label for member in cls}
+            tables = (MappingProxyType(labels), frozenset(labels))
+            setattr(cls, '_achoices_tables', tables)
+        return tables
+
     @classmethod
     def get_label(cls: Any, value: Any) -> Optional[str]:
         """
@@ -17,8 +31,9 @@ class AChoicesMixin:
             return value.label
 
         try:
-            return cls(value).label
-        except (ValueError, KeyError, TypeError):
+            return cls._choice_tables()[0].get(value)
+        except TypeError:
+            # Unhashable value
             return None
 
     @classmethod
@@ -26,13 +41,9 @@ class AChoicesMixin:
         """
         Check whether enum has the passed value or enum member.
         """
-        if isinstance(value, cls):
-            return True
-
         try:
-            cls(value)
-            return True
-        except (ValueError, KeyError, TypeError):
+            return value in cls._choice_tables()[1]
+        except TypeError:
             return False
 
     @classmethod
@@ -40,7 +51,40 @@ class AChoicesMixin:
         """
         Return choices as value-to-label mapping.
         """
-        return {member.value: member.label for member in cls}
+        return dict(cls._choice_tables()[0])
+
+    @classmethod
+    def labels_for(cls: Any, values: Iterable[Any], default: Any = None) -> list[Optional[str]]:
+        """
+        Return labels for many values at once, default for invalid ones.
+
+        @usage: labels = Role.Variant.labels_for(Role.objects.values_list('name', flat=True))
+        """
+        labels = cls._choice_tables()[0]
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        try:
+            return [labels.get(value, default) for value in values]
+        except TypeError:
+            # Unhashable value somewhere, resolve one by one
+            return [label if (label := cls.get_label(value)) is not None else default for value in values]
+
+    @classmethod
+    def as_case(cls: Any, field_name: str, default: Optional[str] = None) -> Case:
+        """
+        Return Case/When expression mapping stored values of field to labels in SQL,
+        labels are translated to the active language when called.
+
+        :param field_name: Field (or lookup path) storing choices values.
+        :param default: Label for values missing in choices.
+
+        @usage: Order.objects.annotate(status_label=OrderStatus.as_case('status')).order_by('status_label')
+        """
+        return Case(
+            *(When(**{field_name: value}, then=Value(str(label))) for value, label in cls._choice_tables()[0].items()),
+            default=Value(default),
+            output_field=CharField(),
+        )
 
 
 class ATextChoices(AChoicesMixin, TextChoices):
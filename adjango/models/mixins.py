@@ -5,10 +5,13 @@ from typing import Any
 
 from django.db import transaction
 from django.db.models import DateTimeField, FileField
+from django.db.models.signals import class_prepared
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from adjango.managers.base import FileCleanupManager
 from adjango.models import Model
+from adjango.utils.files import schedule_file_deletion
 
 
 class CreatedAtMixin(Model):
@@ -63,6 +66,10 @@ class FileCleanupMixin(Model):
     """
     Auto cleanup for FileField/ImageField files on replace/delete.
 
+    Bulk QuerySet.delete(), update() and bulk_update() clean files too, see FileCleanupQuerySet.
+    Rows deleted by cascade from other models are not tracked.
+    Files are deleted after commit by ADJANGO_FILE_CLEANUP_EXECUTOR (inline, thread or celery).
+
     Configuration examples:
     - FILE_CLEANUP = True
     - FILE_CLEANUP = False
@@ -75,12 +82,48 @@ class FileCleanupMixin(Model):
 
     FILE_CLEANUP: bool | dict[str, bool | dict[str, bool]] = True
 
+    objects = FileCleanupManager()
+
     class Meta:
         abstract = True
 
     @classmethod
-    def _file_fields(cls) -> list[FileField]:
-        return [field for field in cls._meta.concrete_fields if isinstance(field, FileField)]
+    def _file_cleanup_plan(cls) -> dict[str, Any]:
+        """
+        Per-class file fields and cleanup policies, built once at class_prepared.
+        """
+        plan = cls.__dict__.get('_file_cleanup')
+        if plan is None:
+            plan = cls._build_file_cleanup_plan()
+        return plan
+
+    @classmethod
+    def _build_file_cleanup_plan(cls) -> dict[str, Any]:
+        config = getattr(cls, 'FILE_CLEANUP', True)
+        # Validate whole config, also entries for fields this model doesn't have
+        for name in ('*', *(config if isinstance(config, dict) else ())):
+            cls._resolve_field_policy(name)
+
+        fields = tuple(field for field in cls._meta.concrete_fields if isinstance(field, FileField))
+        policies = {field.name: cls._resolve_field_policy(field.name) for field in fields}
+        plan = {
+            'fields': fields,
+            'policies': policies,
+            'on_replace': tuple(
+                field for field in fields
+                if policies[field.name]['enabled'] and policies[field.name]['on_replace']
+            ),
+            'on_delete': tuple(
+                field for field in fields
+                if policies[field.name]['enabled'] and policies[field.name]['on_delete']
+            ),
+        }
+        cls._file_cleanup = plan
+        return plan
+
+    @classmethod
+    def _file_fields(cls) -> tuple[FileField, ...]:
+        return cls._file_cleanup_plan()['fields']
 
     @classmethod
     def _normalize_entry(
@@ -107,7 +150,7 @@ class FileCleanupMixin(Model):
         return policy
 
     @classmethod
-    def _field_policy(cls, field_name: str) -> dict[str, bool]:
+    def _resolve_field_policy(cls, field_name: str) -> dict[str, bool]:
         default_policy = {'enabled': True, 'on_replace': True, 'on_delete': True}
         config = getattr(cls, 'FILE_CLEANUP', True)
 
@@ -121,61 +164,94 @@ class FileCleanupMixin(Model):
         base_policy = cls._normalize_entry(config.get('*', True), default_policy)
         return cls._normalize_entry(config.get(field_name), base_policy)
 
+    @classmethod
+    def _field_policy(cls, field_name: str) -> dict[str, bool]:
+        policy = cls._file_cleanup_plan()['policies'].get(field_name)
+        return dict(policy) if policy is not None else cls._resolve_field_policy(field_name)
+
     @staticmethod
-    def _schedule_delete(storage: Any, name: str) -> None:
-        if not name:
-            return
-        transaction.on_commit(lambda: storage.delete(name))
+    def _schedule_delete_many(files: list[tuple[FileField, str]], using: str | None = None) -> None:
+        """Deletes (field, name) files in batches after the transaction commits, see schedule_file_deletion."""
+        schedule_file_deletion(files, using)
+
+    @classmethod
+    def from_db(cls, db: str | None, field_names: list[str], values: list[Any]) -> 'FileCleanupMixin':
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_file_names()
+        return instance
+
+    def refresh_from_db(self, using: str | None = None, fields: Any = None, **kwargs: Any) -> None:
+        super().refresh_from_db(using, fields, **kwargs)
+        self._snapshot_file_names(fields)
+
+    def _snapshot_file_names(self, field_names: Any = None) -> None:
+        """Remembers stored names of loaded file fields, so save() doesn't need to SELECT them."""
+        snapshot = self.__dict__.setdefault('_file_cleanup_names', {})
+        for field in self._file_cleanup_plan()['on_replace']:
+            if field_names is not None and field.name not in field_names:
+                continue
+            if field.attname in self.__dict__:
+                value = self.__dict__[field.attname]
+                snapshot[field.name] = getattr(value, 'name', value) or None
 
-    def _collect_replaced_files(self) -> list[tuple[Any, str]]:
+    def _collect_replaced_files(self, update_fields: Any = None) -> list[tuple[FileField, str]]:
         if not self.pk:
             return []
 
-        fields = self._file_fields()
+        fields = self._file_cleanup_plan()['on_replace']
+        if update_fields is not None:
+            fields = tuple(field for field in fields if field.name in update_fields)
         if not fields:
             return []
 
-        field_names = [field.name for field in fields]
-        old_values = self.__class__.objects.filter(pk=self.pk).values(*field_names).first()
-        if not old_values:
-            return []
-
-        to_delete: list[tuple[Any, str]] = []
+        snapshot = self.__dict__.get('_file_cleanup_names', {})
+        old_values = {field.name: snapshot[field.name] for field in fields if field.name in snapshot}
+        # Fall back to SELECT for instances not loaded from the database or deferred fields
+        missing = [field.name for field in fields if field.name not in snapshot]
+        if missing:
+            row = self.__class__.objects.filter(pk=self.pk).values(*missing).first()
+            if not row:
+                return []
+            old_values.update(row)
+
+        to_delete: list[tuple[FileField, str]] = []
         for field in fields:
-            policy = self._field_policy(field.name)
-            if not (policy['enabled'] and policy['on_replace']):
-                continue
-
             old_name = old_values.get(field.name)
             new_file = getattr(self, field.name)
             new_name = getattr(new_file, 'name', None)
 
             if old_name and old_name != new_name:
-                to_delete.append((field.storage, old_name))
+                to_delete.append((field, old_name))
 
         return to_delete
 
-    def _collect_deleted_files(self) -> list[tuple[Any, str]]:
-        to_delete: list[tuple[Any, str]] = []
-        for field in self._file_fields():
-            policy = self._field_policy(field.name)
-            if not (policy['enabled'] and policy['on_delete']):
-                continue
-
+    def _collect_deleted_files(self) -> list[tuple[FileField, str]]:
+        to_delete: list[tuple[FileField, str]] = []
+        for field in self._file_cleanup_plan()['on_delete']:
             file_obj = getattr(self, field.name)
             name = getattr(file_obj, 'name', None)
             if name:
-                to_delete.append((field.storage, name))
+                to_delete.append((field, name))
         return to_delete
 
     def save(self, *args: Any, **kwargs: Any) -> None:
-        to_delete = self._collect_replaced_files()
+        update_fields = kwargs.get('update_fields')
+        to_delete = self._collect_replaced_files(update_fields)
         super().save(*args, **kwargs)
-        for storage, name in to_delete:
-            self._schedule_delete(storage, name)
+        self._snapshot_file_names(update_fields)
+        self._schedule_delete_many(to_delete, self._state.db)
 
     def delete(self, *args: Any, **kwargs: Any) -> None:
+        using = self._state.db
         to_delete = self._collect_deleted_files()
         super().delete(*args, **kwargs)
-        for storage, name in to_delete:
-            self._schedule_delete(storage, name)
+        self._schedule_delete_many(to_delete, using)
+
+
+def _prepare_file_cleanup(sender: type, **kwargs: Any) -> None:
+    """Builds cleanup plan of each concrete FileCleanupMixin model, invalid FILE_CLEANUP fails on import."""
+    if issubclass(sender, FileCleanupMixin):
+        sender._build_file_cleanup_plan()
+
+
+class_prepared.connect(_prepare_file_cleanup, dispatch_uid='adjango_file_cleanup_prepare')
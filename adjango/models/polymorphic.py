@@ -1,7 +1,9 @@
 # models/polymorphic.py
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections import defaultdict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable
 
 from typing_extensions import Self
 
@@ -11,15 +13,42 @@ if TYPE_CHECKING:
 try:
     from asgiref.sync import sync_to_async
     from polymorphic.models import PolymorphicModel as DjangoPolymorphicModel
+    from polymorphic.models import PolymorphicTypeInvalid
 
+    from adjango.managers.polymorphic import APolymorphicManager
     from adjango.models.base import Model
+    from adjango.utils.contenttypes import get_ctype_model
 
     class PolymorphicModel(DjangoPolymorphicModel, Model):
-        """Enhanced polymorphic model with service integration."""
+        """
+        Enhanced polymorphic model with service integration.
+        objects.abase_only() returns base rows in one query, optionally upcast lazily.
+        """
+
+        objects = APolymorphicManager()
 
         class Meta:
             abstract = True
 
+        def get_real_instance_class(self) -> type[Self] | None:
+            """
+            Gets real model class from the process-wide ctype table (utils.contenttypes),
+            without ContentType lookups.
+            """
+            if self.polymorphic_ctype_id is None:
+                return super().get_real_instance_class()
+            model = get_ctype_model(self.polymorphic_ctype_id, self._state.db)
+            proxy_for_model = self.__class__._meta.proxy_for_model
+            if (
+                model is not None
+                and not issubclass(model, self.__class__)
+                and (proxy_for_model is None or not issubclass(model, proxy_for_model))
+            ):
+                raise PolymorphicTypeInvalid(
+                    f'ContentType {self.polymorphic_ctype_id} for {model} #{self.pk} does not point to a subclass!'
+                )
+            return model
+
         async def aget_real_instance(self) -> Self | None:
             """
             Async gets real instance of polymorphic model.
@@ -28,11 +57,101 @@ try:
             """
             return await sync_to_async(self.get_real_instance)()
 
+        @classmethod
+        def get_real_instances(cls, objs: Iterable[Self]) -> list[Self | None]:
+            """
+            Gets real instances of objects with one pk__in query per real model.
+
+            :param objs: Objects of polymorphic model, e.g. loaded with non_polymorphic().
+            :return: Real instances in the order of objs, None if real row is not found.
+                     Objects which are already real instances are returned as is.
+            """
+            objs = list(objs)
+            groups: defaultdict[tuple[str | None, int], list[Any]] = defaultdict(list)
+            for obj in objs:
+                if obj.polymorphic_ctype_id is not None:
+                    groups[(obj._state.db, obj.polymorphic_ctype_id)].append(obj)
+
+            real: dict[int, Any] = {id(obj): obj for obj in objs if obj.polymorphic_ctype_id is None}
+            for (db, ctype_id), group in groups.items():
+                model = get_ctype_model(ctype_id, db)
+                pending = {}
+                for obj in group:
+                    if obj.__class__ is model:
+                        real[id(obj)] = obj
+                    elif model is not None:
+                        pending.setdefault(obj.pk, []).append(obj)
+                if not pending:
+                    continue
+                queryset = model._base_manager.db_manager(db).filter(pk__in=list(pending))
+                if hasattr(queryset, 'non_polymorphic'):
+                    queryset = queryset.non_polymorphic()
+                for instance in queryset:
+                    for obj in pending[instance.pk]:
+                        real[id(obj)] = instance
+            return [real.get(id(obj)) for obj in objs]
+
+        @classmethod
+        async def aget_real_instances(cls, objs: Iterable[Self]) -> list[Self | None]:
+            """
+            Async gets real instances of objects in one thread hop, see get_real_instances.
+
+            @usage: products = await Product.aget_real_instances([p async for p in Product.objects.non_polymorphic()])
+            """
+            return await sync_to_async(cls.get_real_instances)(list(objs))
+
         @property
         def service(self) -> 'BaseService':
             """Return service instance for this model. Must be implemented in subclasses."""
             raise NotImplementedError(f'Define service property in your model {self.__class__.__name__}')
 
+    class _LazyUpcastMixin:
+        """
+        Mixin of per-model row classes returned by abase_only(lazy_upcast=True).
+        Keeps lazy upcast off the model itself, so missing attributes of regular
+        instances (e.g. reverse one-to-one) raise as usual.
+        """
+
+        @property  # type: ignore[misc]
+        def __class__(self) -> type:
+            # Report the model for save()/delete() signal senders, Collector and isinstance()
+            return self._meta.model
+
+        def __getattr__(self, name: str) -> Any:
+            # Only called for attributes missing on the model, e.g. subclass fields
+            group = None if name.startswith('_') else self.__dict__.get('_lazy_upcast')
+            model = self._meta.model
+            if group is None or self.polymorphic_ctype_id is None:
+                raise AttributeError(f"'{model.__name__}' object has no attribute '{name}'")
+            real_model = self.get_real_instance_class()
+            if real_model is None or real_model is model or not hasattr(real_model, name):
+                raise AttributeError(f"'{model.__name__}' object has no attribute '{name}'")
+
+            if '_upcast_instance' not in self.__dict__:
+                siblings = [
+                    obj for obj in group
+                    if obj.polymorphic_ctype_id == self.polymorphic_ctype_id and '_upcast_instance' not in obj.__dict__
+                ]
+                for obj, real in zip(siblings, model.get_real_instances(siblings)):
+                    obj.__dict__['_upcast_instance'] = real
+            real = self.__dict__['_upcast_instance']
+            if real is None:
+                raise AttributeError(f"'{model.__name__}' object has no attribute '{name}'")
+            return getattr(real, name)
+
+    @lru_cache(maxsize=None)
+    def lazy_upcast_class(model: type[PolymorphicModel]) -> type:
+        """
+        Returns row class of model for abase_only(lazy_upcast=True). Created with type.__new__,
+        so ModelBase doesn't register it as a model.
+        """
+        return type.__new__(
+            type(model),
+            f'Lazy{model.__name__}',
+            (_LazyUpcastMixin, model),
+            {'__module__': model.__module__, '__qualname__': f'Lazy{model.__qualname__}'},
+        )
+
 except ImportError:
     # django-polymorphic not installed
     pass
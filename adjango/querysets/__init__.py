@@ -0,0 +1,9 @@
+from .base import AQuerySet, FileCleanupQuerySet
+
+__all__ = ['AQuerySet', 'FileCleanupQuerySet']
+
+try:
+    from .polymorphic import APolymorphicQuerySet
+    __all__.append('APolymorphicQuerySet')
+except ImportError:
+    pass
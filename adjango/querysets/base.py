@@ -0,0 +1,211 @@
+# querysets/base.py
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Iterable, Optional, Type, TypeVar
+
+from asgiref.sync import sync_to_async
+from django.db import connections, router
+from django.db.models import FileField, Model, QuerySet
+
+from adjango.utils.funcs import aiter_chunks
+
+_M = TypeVar('_M', bound=Model)
+
+
+class AQuerySet(QuerySet[_M]):
+    """
+    QuerySet with async helpers evaluated in a single thread hop.
+    Already evaluated or prefetched querysets are returned without a thread hop.
+    """
+
+    async def aall(self) -> list[_M]:
+        """
+        Async returns all objects of QuerySet.
+
+        @usage: orders = await Order.objects.filter(user=user).aall()
+                products = await order.products.aall()  # no query if prefetched
+        """
+        if self._result_cache is not None:
+            return list(self._result_cache)
+        return await sync_to_async(list)(self)
+
+    async def afilter(self, *args: Any, **kwargs: Any) -> list[_M]:
+        """
+        Async returns objects matching given filter parameters.
+        """
+        return await self.filter(*args, **kwargs).aall()
+
+    async def agetorn(
+            self,
+            exception: Type[Exception] | Exception | None = None,
+            *args: Any,
+            **kwargs: Any,
+    ) -> _M | None:
+        """
+        Async gets single object matching passed parameters, see BaseService.agetorn.
+
+        :param exception: Exception class or exception instance to raise if object not found.
+                          If None, returns None.
+
+        :return: Model object or None if object not found and exception not specified.
+        """
+        from adjango.services.base import BaseService
+
+        return await BaseService.agetorn(self, exception, *args, **kwargs)
+
+    async def agetorn_many(
+            self,
+            field: str = 'pk',
+            values: Iterable[Any] = (),
+            exception: Type[Exception] | Exception | None = None,
+    ) -> dict[Any, _M | None]:
+        """
+        Async gets objects by field values with a single __in query, see BaseService.getorn_many.
+
+        :return: Dict of passed value -> model object or None.
+
+        @usage: users = await User.objects.agetorn_many(values=user_ids)
+        """
+        from adjango.services.base import BaseService
+
+        return await BaseService.agetorn_many(self, field, values, exception)
+
+    async def abulk_upsert(
+            self,
+            objs: Iterable[_M],
+            unique_fields: Iterable[str],
+            update_fields: Optional[Iterable[str]] = None,
+            batch_size: Optional[int] = None,
+    ) -> list[_M]:
+        """
+        Async inserts objects, updating rows that conflict on unique_fields.
+
+        :param objs: Objects to insert or update.
+        :param unique_fields: Fields identifying conflicting rows. Backends without conflict targets
+                              (MySQL, MariaDB) don't accept them and update rows conflicting
+                              on any unique constraint instead.
+        :param update_fields: Fields to update on conflict. By default all concrete
+                              non-primary-key fields except unique_fields and auto_now_add ones.
+                              If nothing is left to update, conflicts are ignored.
+        :param batch_size: Objects per INSERT query.
+
+        :return: List of passed objects.
+
+        @usage: await Product.objects.abulk_upsert(products, unique_fields=['sku'])
+        """
+        unique_fields = list(unique_fields)
+        if update_fields is None:
+            update_fields = [
+                field.name
+                for field in self.model._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in unique_fields
+                and not getattr(field, 'auto_now_add', False)
+            ]
+        update_fields = list(update_fields)
+        if not update_fields:
+            return await self.abulk_create(objs, batch_size=batch_size, ignore_conflicts=True)
+        if not connections[self._write_db()].features.supports_update_conflicts_with_target:
+            unique_fields = None
+        return await self.abulk_create(
+            objs,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=update_fields,
+        )
+
+    def _write_db(self) -> str:
+        return self._db or router.db_for_write(self.model, **self._hints)
+
+    def aiter_chunks(self, chunk_size: int = 2000) -> AsyncIterator[list[_M]]:
+        """
+        Async iterates over QuerySet in lists of at most chunk_size objects, see utils.funcs.aiter_chunks.
+
+        @usage: async for orders in Order.objects.filter(status='new').aiter_chunks(1000): ...
+        """
+        return aiter_chunks(self, chunk_size)
+
+
+class FileCleanupQuerySet(AQuerySet[_M]):
+    """
+    AQuerySet of FileCleanupMixin models, deletes stored files on bulk delete(), update()
+    and bulk_update() according to the model FILE_CLEANUP policy.
+    Old file names are read with one values_list query, files are deleted in one batch on commit.
+    """
+
+    def _cleanup_fields(self, mode: str, names: Optional[Iterable[str]] = None) -> tuple[FileField, ...]:
+        fields = self.model._file_cleanup_plan()[mode]
+        if names is not None:
+            names = set(names)
+            fields = tuple(field for field in fields if field.name in names)
+        return fields
+
+    def delete(self) -> tuple[int, dict[str, int]]:
+        fields = self._cleanup_fields('on_delete')
+        if not fields:
+            return super().delete()
+        using = self._write_db()
+        rows = list(self.using(using).values_list(*(field.attname for field in fields)))
+        result = super().delete()
+        self.model._schedule_delete_many(
+            [(field, name) for row in rows for field, name in zip(fields, row)],
+            using,
+        )
+        return result
+
+    def update(self, **kwargs: Any) -> int:
+        fields = self._cleanup_fields('on_replace', kwargs)
+        if not fields:
+            return super().update(**kwargs)
+        using = self._write_db()
+        attnames = [field.attname for field in fields]
+        old_rows = {pk: row for pk, *row in self.using(using).values_list('pk', *attnames)}
+        result = super().update(**kwargs)
+
+        if any(hasattr(kwargs[field.name], 'resolve_expression') for field in fields):
+            # New names are computed by the database
+            new_rows = {
+                pk: row
+                for pk, *row in self.model._base_manager.using(using)
+                .filter(pk__in=list(old_rows))
+                .values_list('pk', *attnames)
+            }
+        else:
+            new_row = [getattr(kwargs[field.name], 'name', kwargs[field.name]) for field in fields]
+            new_rows = dict.fromkeys(old_rows, new_row)
+
+        self.model._schedule_delete_many(
+            [
+                (field, old_name)
+                for pk, row in old_rows.items()
+                for field, old_name, new_name in zip(fields, row, new_rows.get(pk, row))
+                if old_name != new_name
+            ],
+            using,
+        )
+        return result
+
+    def bulk_update(self, objs: Iterable[_M], fields: Iterable[str], batch_size: Optional[int] = None) -> int:
+        objs = tuple(objs)
+        fields = list(fields)
+        cleanup_fields = self._cleanup_fields('on_replace', fields)
+        if not cleanup_fields or not objs:
+            return super().bulk_update(objs, fields, batch_size=batch_size)
+        using = self._write_db()
+        old_rows = {
+            pk: row
+            for pk, *row in self.model._base_manager.using(using)
+            .filter(pk__in=[obj.pk for obj in objs])
+            .values_list('pk', *(field.attname for field in cleanup_fields))
+        }
+        result = super().bulk_update(objs, fields, batch_size=batch_size)
+
+        to_delete = []
+        for obj in objs:
+            for field, old_name in zip(cleanup_fields, old_rows.get(obj.pk, ())):
+                if old_name != getattr(getattr(obj, field.attname), 'name', None):
+                    to_delete.append((field, old_name))
+            obj._snapshot_file_names(fields)
+        self.model._schedule_delete_many(to_delete, using)
+        return result
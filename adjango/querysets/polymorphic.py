@@ -0,0 +1,74 @@
+# querysets/polymorphic.py
+from __future__ import annotations
+
+from typing import Collection, Iterable, Optional, TypeVar
+
+from django.db.models import Model
+
+from adjango.querysets.base import AQuerySet
+
+_M = TypeVar('_M', bound=Model)
+
+try:
+    from polymorphic.query import PolymorphicQuerySet
+
+    class APolymorphicQuerySet(PolymorphicQuerySet, AQuerySet[_M]):
+        """PolymorphicQuerySet with AQuerySet async helpers and a non-polymorphic fast path."""
+
+        def bulk_create(
+                self,
+                objs: Iterable[_M],
+                batch_size: Optional[int] = None,
+                ignore_conflicts: bool = False,
+                update_conflicts: bool = False,
+                update_fields: Optional[Collection[str]] = None,
+                unique_fields: Optional[Collection[str]] = None,
+        ) -> list[_M]:
+            """
+            Sets polymorphic ctype like PolymorphicQuerySet.bulk_create, but keeps update_conflicts
+            (dropped there, which turned upserts into plain INSERTs). The ctype of existing rows
+            is never updated, so upserting through a base model doesn't change their type.
+            """
+            objs = list(objs)
+            for obj in objs:
+                obj.pre_save_polymorphic()
+            if update_conflicts:
+                ctype_names = ('polymorphic_ctype', 'polymorphic_ctype_id')
+                update_fields = [name for name in update_fields or () if name not in ctype_names]
+                if not update_fields:
+                    update_conflicts, ignore_conflicts, unique_fields = False, True, None
+            return super(PolymorphicQuerySet, self).bulk_create(
+                objs,
+                batch_size,
+                ignore_conflicts=ignore_conflicts,
+                update_conflicts=update_conflicts,
+                update_fields=update_fields,
+                unique_fields=unique_fields,
+            )
+
+        async def abase_only(self, lazy_upcast: bool = False) -> list[_M]:
+            """
+            Async returns base model rows in a single query, without per-type follow-up queries.
+
+            :param lazy_upcast: Fetch subclass row only when a subclass-only attribute is accessed,
+                                for all loaded rows of the same type in one query. Runs a query
+                                on attribute access, so use it in sync code (serializers, sync_to_async).
+
+            :return: List of base model instances.
+
+            @usage: products = await Product.objects.filter(price__gt=0).abase_only()
+                    products = await Product.objects.abase_only(lazy_upcast=True)
+                    products[0].author  # Book row loaded for all Books of the list
+            """
+            objs = await self.non_polymorphic().aall()
+            if lazy_upcast:
+                from adjango.models.polymorphic import lazy_upcast_class
+
+                for obj in objs:
+                    obj.__class__ = lazy_upcast_class(obj._meta.model)
+                    obj.__dict__['_lazy_upcast'] = objs
+            return objs
+
+except ImportError:
+    # django-polymorphic not installed
+    pass
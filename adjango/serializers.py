@@ -1,15 +1,24 @@
 # serializers.py
 try:
-    from rest_framework.serializers import BaseSerializer  # noqa
+    from rest_framework.serializers import BaseSerializer, ListSerializer  # noqa
 except ImportError:
     pass
-from typing import Dict, Optional, Tuple, Type, TypeVar, Union, cast
+import copy
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, Union, cast
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch, QuerySet
 
 from adjango.aserializers import AModelSerializer
 
 T = TypeVar('T', bound=AModelSerializer)
 
 
+# Upper bound of distinct dynamic serializer classes kept alive by the cache
+DYNAMIC_SERIALIZER_CACHE_SIZE = 256
+
+
 def dynamic_serializer(
     base_serializer: Type[T],
     include_fields: Tuple[str, ...],
@@ -19,12 +28,38 @@ def dynamic_serializer(
     Creates dynamic serializer based on base serializer,
     including specified fields and overriding some of them when needed.
 
+    Generated classes are memoized by (base_serializer, include_fields, field_overrides identity),
+    so repeated calls inside views return the same class and DRF per-class caches stay warm.
+
+    Generated class exposes optimize_queryset(queryset) which applies only() for the selected
+    concrete fields and select_related/prefetch_related for the selected relations
+    (forward relations are joined only when rendered by a nested serializer).
+
     :param base_serializer: Base serializer class.
     :param include_fields: Tuple of field names to include.
     :param field_overrides: Dictionary with field overrides, where key is field name,
                             and value is serializer class or serializer instance.
+                            Instances are deep-copied for every serializer (as DRF does for
+                            declared fields), so the bound field is a copy, not the passed instance.
     :return: New serializer class.
     """
+    overrides = tuple((field_overrides or {}).items())
+    for field_name, serializer in overrides:
+        if not (
+            (isinstance(serializer, type) and issubclass(serializer, BaseSerializer))
+            or isinstance(serializer, BaseSerializer)
+        ):
+            raise ValueError(f'Invalid serializer for field \'{field_name}\'.')
+    return cast(Type[T], _build_dynamic_serializer(base_serializer, tuple(include_fields), overrides))
+
+
+@lru_cache(maxsize=DYNAMIC_SERIALIZER_CACHE_SIZE)
+def _build_dynamic_serializer(
+    base_serializer: Type[T],
+    include_fields: Tuple[str, ...],
+    overrides: Tuple[Tuple[str, Union[Type[BaseSerializer], BaseSerializer]], ...],
+) -> Type[T]:
+    """Builds dynamic serializer class, see dynamic_serializer."""
 
     # Resolve model for Meta considering swappable User model
     resolved_model = None
@@ -52,31 +87,111 @@ def dynamic_serializer(
 
     # Store field overrides for later use
     field_overrides_to_apply = {}
-    if field_overrides:
-        for field_name, serializer in field_overrides.items():
-            if isinstance(serializer, type) and issubclass(serializer, BaseSerializer):
-                # If serializer class is passed, create its instance
-                field_overrides_to_apply[field_name] = serializer(read_only=True)
-            elif isinstance(serializer, BaseSerializer):
-                # If serializer instance is passed, use it directly
-                field_overrides_to_apply[field_name] = serializer
-            else:
-                raise ValueError(f'Invalid serializer for field \'{field_name}\'.')
+    for field_name, serializer in overrides:
+        if isinstance(serializer, type):
+            # If serializer class is passed, create its instance
+            field_overrides_to_apply[field_name] = serializer(read_only=True)
+        else:
+            # If serializer instance is passed, use it directly
+            field_overrides_to_apply[field_name] = serializer
 
     # Create custom __init__ that applies field overrides
     original_init = base_serializer.__init__
 
     def __init__(self, *args, **kwargs):
         original_init(self, *args, **kwargs)
-        # Apply field overrides after the fields are created
+        # Apply field overrides after the fields are created. The class is memoized,
+        # so each serializer binds its own copy, as DRF does for _declared_fields
         for field_name, field_instance in field_overrides_to_apply.items():
             if hasattr(self, 'fields') and field_name in self.fields:
-                self.fields[field_name] = field_instance
+                self.fields[field_name] = copy.deepcopy(field_instance)
 
     attrs['__init__'] = __init__
 
+    def optimize_queryset(cls, queryset: QuerySet) -> QuerySet:
+        """
+        Narrows queryset to what this serializer renders.
+
+        :param queryset: QuerySet of serializer model.
+        :return: QuerySet with only/select_related/prefetch_related applied.
+        """
+        return _optimize_queryset(queryset, include_fields, cls._declared_fields, field_overrides_to_apply)
+
+    attrs['optimize_queryset'] = classmethod(optimize_queryset)
+
     # Create new serializer class
     dynamic_class = type('DynamicSerializer', (base_serializer,), attrs)
 
     # Cast type to Type[T] using cast
     return cast(Type[T], dynamic_class)
+
+
+def _optimize_queryset(
+    queryset: QuerySet,
+    include_fields: Tuple[str, ...],
+    declared_fields: Dict[str, Any],
+    field_overrides: Dict[str, Any],
+) -> QuerySet:
+    """
+    Applies only()/select_related()/prefetch_related() matching the included serializer fields.
+    only() is skipped if any field reads data that can't be mapped to a model column
+    (SerializerMethodField, dotted source, property), so narrowing never causes deferred loads.
+    It is also skipped for polymorphic querysets, whose upcast rows would load the deferred
+    subclass columns one by one, and for joined reverse one-to-one relations.
+    """
+    opts = queryset.model._meta
+    only_fields = []
+    select_related = []
+    prefetch_related = []
+    # Plain querysets have no polymorphic_disabled, non_polymorphic() ones don't upcast
+    narrow = getattr(queryset, 'polymorphic_disabled', True)
+
+    for name in include_fields:
+        field = field_overrides.get(name, declared_fields.get(name))
+        source = getattr(field, 'source', None) or name
+        if source == '*' or '.' in source:
+            narrow = False
+            continue
+        try:
+            model_field = opts.get_field(source)
+        except FieldDoesNotExist:
+            narrow = False
+            continue
+
+        if model_field.many_to_many or model_field.one_to_many:
+            prefetch_related.append(_nested_prefetch(source, model_field, field))
+        elif model_field.one_to_one or (model_field.many_to_one and model_field.concrete):
+            # Primary key fields render the column value, only nested serializers need the JOIN.
+            # Reverse one-to-one has no column, so it is always joined
+            if isinstance(field, BaseSerializer) or not model_field.concrete:
+                select_related.append(source)
+            if model_field.concrete:
+                only_fields.append(source)
+            else:
+                # Columns of the joined row can't be both deferred and traversed
+                narrow = False
+        elif model_field.concrete:
+            only_fields.append(source)
+        else:
+            # GenericForeignKey and other virtual fields depend on unknown columns
+            narrow = False
+
+    if narrow:
+        queryset = queryset.only(*only_fields)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+def _nested_prefetch(source: str, model_field: Any, field: Any) -> Union[str, Prefetch]:
+    """
+    Prefetch for many relation, narrowed by nested dynamic serializer when possible.
+    Reverse foreign keys are prefetched as is, since narrowing could defer the back reference.
+    """
+    nested = field.child if isinstance(field, ListSerializer) else field
+    optimize = getattr(nested, 'optimize_queryset', None)
+    if optimize is None or not model_field.many_to_many:
+        return source
+    return Prefetch(source, queryset=optimize(model_field.related_model._default_manager.all()))
@@ -1,14 +1,125 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import TYPE_CHECKING, Any, Type, TypeVar
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Type, TypeVar
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Manager
+from django.db.models.query import ModelIterable
 
 if TYPE_CHECKING:
     from django.db.models import Model as DjangoModel  # noqa
     from django.db.models import QuerySet
 
+    from adjango.services.cache import CachePolicy
+
 _M = TypeVar('_M', bound='DjangoModel')
 
+_identity_map: ContextVar[Optional['IdentityMap']] = ContextVar('_identity_map', default=None)
+
+
+class IdentityMap:
+    """
+    Request-scoped map of model instances fetched by BaseService.getorn/agetorn
+    with a single pk or unique field lookup on an unfiltered QuerySet.
+    Stored in a contextvar, so it works under ASGI and in sync_to_async threads.
+    Entries are dropped on save()/delete() of adjango.models.base.Model instances;
+    QuerySet.update() and bulk operations are not tracked.
+
+    @usage:
+        with IdentityMap.scope():
+            order = await BaseService.agetorn(Order.objects, pk=order_id)
+            same = await BaseService.agetorn(Order.objects, pk=order_id)  # no query
+    """
+
+    def __init__(self) -> None:
+        self._objects: dict[tuple, Any] = {}
+        self._keys: defaultdict[tuple, set[tuple]] = defaultdict(set)
+
+    @staticmethod
+    def current() -> Optional['IdentityMap']:
+        return _identity_map.get()
+
+    @classmethod
+    @contextmanager
+    def scope(cls) -> Iterator['IdentityMap']:
+        """Activates new identity map for the enclosed code."""
+        token = _identity_map.set(cls())
+        try:
+            yield _identity_map.get()
+        finally:
+            _identity_map.reset(token)
+
+    @staticmethod
+    def invalidate(obj: 'DjangoModel') -> None:
+        """Drops obj from the active identity map, if any."""
+        identity_map = _identity_map.get()
+        if identity_map is not None:
+            identity_map.discard(obj)
+
+    @staticmethod
+    def lookup_key(queryset: 'QuerySet', args: tuple, kwargs: dict) -> Optional[tuple]:
+        """
+        Cache key for a single exact pk/unique field lookup on an unfiltered QuerySet,
+        None if the lookup can't be served from the map.
+        """
+        if isinstance(queryset, Manager):
+            queryset = queryset.all()
+        query = queryset.query
+        if (
+            args
+            or len(kwargs) != 1
+            or query.where
+            or query.annotations
+            or query.select_related
+            or query.extra
+            or query.is_sliced
+            or query.distinct
+            or query.combinator
+            or query.select_for_update
+            or query.deferred_loading != (frozenset(), True)
+            or queryset._prefetch_related_lookups
+            or not issubclass(queryset._iterable_class, ModelIterable)
+            # non_polymorphic() rows would share the key of polymorphic ones
+            or getattr(queryset, 'polymorphic_disabled', False)
+        ):
+            return None
+
+        ((lookup, value),) = kwargs.items()
+        name = lookup.removesuffix('__exact')
+        opts = queryset.model._meta
+        try:
+            field = opts.pk if name == 'pk' else opts.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        # Multi-table inheritance children have the parent link as pk
+        if not field.concrete or not (field.primary_key or field.unique and not field.is_relation):
+            return None
+        try:
+            value = field.to_python(value)
+        except ValidationError:
+            return None
+        return queryset.model, queryset.db, field.attname, value
+
+    def get(self, key: tuple) -> Any:
+        return self._objects.get(key)
+
+    def add(self, key: tuple, obj: 'DjangoModel') -> None:
+        model, db = key[0], key[1]
+        pk_key = (model, db, model._meta.pk.attname, obj.pk)
+        self._objects[key] = self._objects[pk_key] = obj
+        self._keys[(model._meta.concrete_model, obj.pk)].update((key, pk_key))
+
+    def discard(self, obj: 'DjangoModel') -> None:
+        models = {type(obj), *obj._meta.get_parent_list()}
+        for model in {model._meta.concrete_model for model in models}:
+            for key in self._keys.pop((model, obj.pk), ()):
+                self._objects.pop(key, None)
+
 
 class BaseService(ABC):
     """Base service class for model operations."""
@@ -22,6 +133,7 @@ class BaseService(ABC):
     ) -> _M | None:
         """
         Gets single object from given QuerySet matching passed parameters.
+        Inside IdentityMap.scope() pk/unique lookups are served from the identity map.
 
         :param queryset: QuerySet to get object from.
         :param exception: Exception class or exception instance to raise if object not found.
@@ -29,38 +141,152 @@ class BaseService(ABC):
 
         :return: Model object or None if object not found and exception not specified.
         """
+        identity_map = IdentityMap.current()
+        key = identity_map.lookup_key(queryset, args, kwargs) if identity_map is not None else None
+        if key is not None and (obj := identity_map.get(key)) is not None:
+            return obj
         try:
-            return queryset.get(*args, **kwargs)
+            obj = queryset.get(*args, **kwargs)
         except queryset.model.DoesNotExist:
             if exception is not None:
                 if isinstance(exception, type):
                     raise exception()
                 else:
                     raise exception
-        return None
+            return None
+        if key is not None:
+            identity_map.add(key, obj)
+        return obj
 
     @staticmethod
     async def agetorn(
             queryset: "QuerySet[_M]",
             exception: Type[Exception] | Exception | None = None,
             *args: Any,
+            cache: 'CachePolicy | int | None' = None,
             **kwargs: Any,
     ) -> _M | None:
         """
         Async gets single object from given QuerySet matching passed parameters.
+        Inside IdentityMap.scope() pk/unique lookups are served from the identity map.
 
         :param queryset: QuerySet to get object from.
         :param exception: Exception class or exception instance to raise if object not found.
                           If None, returns None.
+        :param cache: CachePolicy or timeout in seconds to read pk/unique lookups on unfiltered
+                      QuerySet through Django cache (ADJANGO_GETORN_CACHE_ALIAS). Cached instances
+                      are dropped on post_save/post_delete. Other lookups ignore it.
 
         :return: Model object or None if object not found and exception not specified.
+
+        @usage: settings = await BaseService.agetorn(SiteSettings.objects, pk=1, cache=600)
         """
+        identity_map = IdentityMap.current()
+        key = None
+        if identity_map is not None or cache is not None:
+            key = IdentityMap.lookup_key(queryset, args, kwargs)
+        if identity_map is not None and key is not None and (obj := identity_map.get(key)) is not None:
+            return obj
         try:
-            return await queryset.aget(*args, **kwargs)
+            if cache is not None and key is not None:
+                from adjango.services.cache import acached_get
+
+                obj = await acached_get(queryset, key, cache, lambda: queryset.aget(*args, **kwargs))
+            else:
+                obj = await queryset.aget(*args, **kwargs)
         except queryset.model.DoesNotExist:
             if exception is not None:
                 if isinstance(exception, type):
                     raise exception()
                 else:
                     raise exception
-        return None
+            return None
+        if identity_map is not None and key is not None:
+            identity_map.add(key, obj)
+        return obj
+
+    @staticmethod
+    def getorn_many(
+            queryset: "QuerySet[_M]",
+            field: str = 'pk',
+            values: Iterable[Any] = (),
+            exception: Type[Exception] | Exception | None = None,
+    ) -> dict[Any, _M | None]:
+        """
+        Gets objects from given QuerySet by field values with a single __in query.
+        Inside IdentityMap.scope() pk/unique lookups are served from and added to the identity map.
+
+        :param queryset: QuerySet to get objects from.
+        :param field: Field to look objects up by, pk or unique field.
+        :param values: Field values to look up.
+        :param exception: Exception class or exception instance to raise if any object not found.
+                          If None, missing values are mapped to None.
+
+        :return: Dict of passed value -> model object or None.
+
+        @usage: users = BaseService.getorn_many(User.objects, values=user_ids)
+        """
+        if isinstance(queryset, Manager):
+            queryset = queryset.all()
+        model = queryset.model
+        model_field = model._meta.pk if field == 'pk' else model._meta.get_field(field)
+        identity_map = IdentityMap.current()
+        values = list(values)
+
+        result: dict[Any, Any] = {}
+        keys: dict[Any, Optional[tuple]] = {}
+        lookups: dict[Any, list[Any]] = defaultdict(list)
+        for value in values:
+            if value in result or value in keys:
+                continue
+            key = IdentityMap.lookup_key(queryset, (), {field: value}) if identity_map is not None else None
+            if key is not None and (obj := identity_map.get(key)) is not None:
+                result[value] = obj
+                continue
+            keys[value] = key
+            try:
+                lookups[model_field.to_python(value)].append(value)
+            except ValidationError:
+                result[value] = None
+
+        if lookups:
+            for obj in queryset.filter(**{f'{field}__in': list(lookups)}):
+                for value in lookups.get(getattr(obj, model_field.attname), ()):
+                    if result.get(value) is not None:
+                        raise model.MultipleObjectsReturned(
+                            f'get() returned more than one {model._meta.object_name} for {field}={value!r}'
+                        )
+                    result[value] = obj
+                    if keys[value] is not None:
+                        identity_map.add(keys[value], obj)
+
+        result = {value: result.get(value) for value in values}
+        if exception is not None and None in result.values():
+            if isinstance(exception, type):
+                raise exception()
+            else:
+                raise exception
+        return result
+
+    @staticmethod
+    async def agetorn_many(
+            queryset: "QuerySet[_M]",
+            field: str = 'pk',
+            values: Iterable[Any] = (),
+            exception: Type[Exception] | Exception | None = None,
+    ) -> dict[Any, _M | None]:
+        """
+        Async gets objects from given QuerySet by field values with a single __in query,
+        see BaseService.getorn_many.
+
+        :param queryset: QuerySet to get objects from.
+        :param field: Field to look objects up by, pk or unique field.
+        :param values: Field values to look up.
+        :param exception: Exception class or exception instance to raise if any object not found.
+                          If None, missing values are mapped to None.
+
+        :return: Dict of passed value -> model object or None.
+
+        @usage: users = await BaseService.agetorn_many(User.objects, values=user_ids)
+        """
+        return await sync_to_async(BaseService.getorn_many)(queryset, field, list(values), exception)
@@ -0,0 +1,153 @@
+# services/cache.py
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+from weakref import WeakKeyDictionary
+
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+if TYPE_CHECKING:
+    from django.db.models import Model as DjangoModel  # noqa
+    from django.db.models import QuerySet
+
+_KEY_PREFIX = 'adjango:getorn:'
+
+
+class CachePolicy:
+    """
+    Read-through cache policy for BaseService.agetorn(cache=...).
+
+    :param timeout: Seconds to keep instance in cache.
+    :param lock_timeout: Seconds other processes wait for the one loading a missing key
+                         before querying the database themselves.
+    """
+
+    def __init__(self, timeout: int = 300, lock_timeout: float = 5.0) -> None:
+        self.timeout = timeout
+        self.lock_timeout = lock_timeout
+
+    @classmethod
+    def of(cls, policy: 'CachePolicy | int') -> 'CachePolicy':
+        return policy if isinstance(policy, CachePolicy) else cls(timeout=policy)
+
+
+def _cache():
+    from adjango.conf import ADJANGO_GETORN_CACHE_ALIAS
+
+    if ADJANGO_GETORN_CACHE_ALIAS is None:
+        raise ImproperlyConfigured('Set ADJANGO_GETORN_CACHE_ALIAS to use agetorn(cache=...)')
+    return caches[ADJANGO_GETORN_CACHE_ALIAS]
+
+
+# Keys have no db alias: reads go to the router's read alias and invalidation
+# gets the write alias, which differ with read replicas
+def _key(label: str, attname: str, value: Any) -> str:
+    return _KEY_PREFIX + hashlib.md5(f'{label}:{attname}:{value}'.encode()).hexdigest()
+
+
+def _instance_key(label: str, pk: Any) -> str:
+    return _key(label, 'pk', pk)
+
+
+def _model_labels(obj: 'DjangoModel') -> set[str]:
+    models = {type(obj), *obj._meta.get_parent_list()}
+    return {model._meta.concrete_model._meta.label_lower for model in models}
+
+
+class _SingleFlight:
+    """Shares one in-flight load per key between coroutines of the same event loop."""
+
+    _tasks: WeakKeyDictionary = WeakKeyDictionary()
+
+    @classmethod
+    async def run(cls, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        tasks = cls._tasks.setdefault(asyncio.get_running_loop(), {})
+        task = tasks.get(key)
+        if task is None:
+            task = tasks[key] = asyncio.ensure_future(load())
+            task.add_done_callback(lambda _: tasks.pop(key, None))
+        # Waiters must not share one mutable instance
+        return copy.copy(await asyncio.shield(task))
+
+
+async def acached_get(
+        queryset: 'QuerySet',
+        lookup_key: tuple,
+        policy: CachePolicy | int,
+        fetch: Callable[[], Awaitable['DjangoModel']],
+) -> 'DjangoModel':
+    """
+    Gets instance by pk/unique lookup key (see IdentityMap.lookup_key) from cache or via fetch.
+    Instances are stored under their pk, unique lookups store a pointer to the pk
+    which is verified on read, so invalidation only needs to drop the pk entry.
+    Concurrent misses load once per process (single-flight) and once across processes
+    (cache.add lock), others wait for the cached value.
+    """
+    policy = CachePolicy.of(policy)
+    cache = _cache()
+    model, _, attname, value = lookup_key
+    label = model._meta.concrete_model._meta.label_lower
+    is_pk = attname == model._meta.pk.attname
+    pointer_key = None if is_pk else _key(label, attname, value)
+
+    async def cached() -> Optional['DjangoModel']:
+        pk = value if is_pk else await cache.aget(pointer_key)
+        if pk is None:
+            return None
+        obj = await cache.aget(_instance_key(label, pk))
+        if obj is None or not isinstance(obj, model) or getattr(obj, attname) != value:
+            return None
+        return obj
+
+    async def load() -> 'DjangoModel':
+        lock_key = _key(label, attname, value) + ':lock'
+        acquired = await cache.aadd(lock_key, 1, policy.lock_timeout)
+        if not acquired:
+            # Another process is loading this key, wait for its result
+            delay, waited = 0.05, 0.0
+            while waited < policy.lock_timeout:
+                await asyncio.sleep(delay)
+                waited += delay
+                delay = min(delay * 2, 0.5)
+                if (obj := await cached()) is not None:
+                    return obj
+                if await cache.aget(lock_key) is None:
+                    break
+        try:
+            obj = await fetch()
+            await cache.aset(_instance_key(label, obj.pk), obj, policy.timeout)
+            if pointer_key is not None:
+                await cache.aset(pointer_key, obj.pk, policy.timeout)
+            return obj
+        finally:
+            # Waiters which timed out don't own the lock
+            if acquired:
+                await cache.adelete(lock_key)
+
+    obj = await cached()
+    if obj is not None:
+        return obj
+    return await _SingleFlight.run(_key(label, attname, value), load)
+
+
+def invalidate_cached_instance(sender: Any, instance: 'DjangoModel', using: str, **kwargs: Any) -> None:
+    """post_save/post_delete receiver dropping cached instance, again after commit."""
+    if instance.pk is None:
+        return
+    cache = _cache()
+    keys = [_instance_key(label, instance.pk) for label in _model_labels(instance)]
+    cache.delete_many(keys)
+    if transaction.get_connection(using).in_atomic_block:
+        # Other processes may cache the old row until this transaction commits
+        transaction.on_commit(lambda: cache.delete_many(keys), using=using)
+
+
+def connect_cache_invalidation() -> None:
+    post_save.connect(invalidate_cached_instance, dispatch_uid='adjango_getorn_cache_post_save')
+    post_delete.connect(invalidate_cached_instance, dispatch_uid='adjango_getorn_cache_post_delete')
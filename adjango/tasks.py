@@ -13,3 +13,20 @@ log = logging.getLogger(__name__)
 @shared_task(autoretry_for=(Exception,), retry_kwargs={'max_retries': 3, 'countdown': 20})
 def send_emails_task(subject: str, emails: tuple[str, ...] | list[str], template: str, context: dict) -> None:
     send_emails(subject, emails, template, context)
+
+
+@shared_task(bind=True, max_retries=None, default_retry_delay=20)
+def delete_files_task(self, files: list[list[str]]) -> None:
+    """
+    Deletes batch of [model label, field name, file name] files, retrying only failed ones
+    up to ADJANGO_FILE_CLEANUP_RETRIES times.
+    """
+    from adjango.conf import ADJANGO_FILE_CLEANUP_RETRIES
+    from adjango.utils.files import delete_files, deserialize_files, serialize_files
+
+    failed = delete_files(deserialize_files(files))
+    if failed:
+        if self.request.retries >= ADJANGO_FILE_CLEANUP_RETRIES:
+            log.error('Gave up deleting files: %s', [name for _, name in failed])
+            return
+        raise self.retry(kwargs={'files': serialize_files(failed)})
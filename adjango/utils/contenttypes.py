@@ -0,0 +1,67 @@
+# utils/contenttypes.py
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Optional
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_migrate, post_save
+
+# Databases whose ContentTypes are loaded into the ContentType.objects cache
+_warmed: set[str] = set()
+_lock = Lock()
+
+
+def warm_ctype_cache(using: Optional[str] = None) -> None:
+    """
+    Loads ContentTypes of all installed models into the ContentType.objects cache with one query.
+    Called on first lookup, may be called at startup (e.g. in AppConfig.ready of the project,
+    outside of migrations) to avoid it on the first request.
+    """
+    using = using or DEFAULT_DB_ALIAS
+    with _lock:
+        if using in _warmed:
+            return
+        ContentType.objects.db_manager(using).get_for_models(*apps.get_models(), for_concrete_models=False)
+        _warmed.add(using)
+
+
+def _get_ctype(ctype_id: int, using: Optional[str]) -> ContentType:
+    using = using or DEFAULT_DB_ALIAS
+    if using not in _warmed:
+        warm_ctype_cache(using)
+    # Stale ContentTypes and ones created after warm up are fetched and cached by id
+    return ContentType.objects.db_manager(using).get_for_id(ctype_id)
+
+
+def get_ctype_model(ctype_id: int, using: Optional[str] = None) -> Optional[type[Model]]:
+    """
+    Returns model class of ContentType id without a query once the cache is warm,
+    None for stale ContentTypes. Raises ContentType.DoesNotExist for unknown ids.
+
+    @usage: model = get_ctype_model(product.polymorphic_ctype_id)
+    """
+    return _get_ctype(ctype_id, using).model_class()
+
+
+def get_ctype_verbose_name(ctype_id: int, using: Optional[str] = None) -> Any:
+    """
+    Returns verbose name of ContentType id model (same as ContentType.name) without a query
+    once the cache is warm.
+    """
+    return _get_ctype(ctype_id, using).name
+
+
+def clear_ctype_cache(**kwargs: Any) -> None:
+    with _lock:
+        ContentType.objects.clear_cache()
+        _warmed.clear()
+
+
+# ContentTypes are recreated after migrate/flush
+post_migrate.connect(clear_ctype_cache, dispatch_uid='adjango_ctype_cache_post_migrate')
+post_save.connect(clear_ctype_cache, sender=ContentType, dispatch_uid='adjango_ctype_cache_post_save')
+post_delete.connect(clear_ctype_cache, sender=ContentType, dispatch_uid='adjango_ctype_cache_post_delete')
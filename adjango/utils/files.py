@@ -0,0 +1,125 @@
+# utils/files.py
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from threading import Lock
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+
+if TYPE_CHECKING:
+    from django.db.models import FileField
+
+log = logging.getLogger(__name__)
+
+FILE_DELETION_EXECUTORS = ('inline', 'thread', 'celery')
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_thread_pool_lock = Lock()
+
+
+def _batches(files: list, size: int) -> Iterator[list]:
+    iterator = iter(files)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _get_thread_pool() -> ThreadPoolExecutor:
+    from adjango.conf import ADJANGO_FILE_CLEANUP_THREADS
+
+    global _thread_pool
+    with _thread_pool_lock:
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(
+                max_workers=ADJANGO_FILE_CLEANUP_THREADS,
+                thread_name_prefix='adjango-file-cleanup',
+            )
+    return _thread_pool
+
+
+def serialize_files(files: Iterable[tuple['FileField', str]]) -> list[list[str]]:
+    """Converts (field, name) pairs to JSON-serializable [model label, field name, file name]."""
+    return [[field.model._meta.label, field.name, name] for field, name in files]
+
+
+def deserialize_files(files: Iterable[list[str]]) -> list[tuple['FileField', str]]:
+    return [
+        (apps.get_registered_model(*label.split('.'))._meta.get_field(field_name), name)
+        for label, field_name, name in files
+    ]
+
+
+def delete_files(files: Iterable[tuple['FileField', str]]) -> list[tuple['FileField', str]]:
+    """
+    Deletes files from storages of their fields.
+
+    :param files: (field, name) pairs.
+    :return: (field, name) pairs which failed to delete.
+    """
+    failed = []
+    for field, name in files:
+        try:
+            field.storage.delete(name)
+        except Exception:  # noqa
+            log.warning('Failed to delete file %s from %s storage', name, field, exc_info=True)
+            failed.append((field, name))
+    return failed
+
+
+def _delete_files_with_retries(files: list[tuple['FileField', str]], retries: int) -> None:
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(min(2 ** attempt, 30))
+        files = delete_files(files)
+        if not files:
+            return
+    log.error('Gave up deleting files: %s', [name for _, name in files])
+
+
+def execute_file_deletion(files: list[tuple['FileField', str]]) -> None:
+    """
+    Deletes files with ADJANGO_FILE_CLEANUP_EXECUTOR, in batches of ADJANGO_FILE_CLEANUP_BATCH_SIZE:
+    inline - in the calling thread, errors are raised;
+    thread - in a bounded thread pool with retries;
+    celery - in delete_files_task via Tasker.put with retries.
+    """
+    from adjango.conf import (
+        ADJANGO_FILE_CLEANUP_BATCH_SIZE,
+        ADJANGO_FILE_CLEANUP_EXECUTOR,
+        ADJANGO_FILE_CLEANUP_RETRIES,
+    )
+
+    if ADJANGO_FILE_CLEANUP_EXECUTOR == 'inline':
+        for field, name in files:
+            field.storage.delete(name)
+    elif ADJANGO_FILE_CLEANUP_EXECUTOR == 'thread':
+        pool = _get_thread_pool()
+        for batch in _batches(files, ADJANGO_FILE_CLEANUP_BATCH_SIZE):
+            pool.submit(_delete_files_with_retries, batch, ADJANGO_FILE_CLEANUP_RETRIES)
+    elif ADJANGO_FILE_CLEANUP_EXECUTOR == 'celery':
+        from adjango.tasks import delete_files_task
+        from adjango.utils.celery.tasker import Tasker
+
+        for batch in _batches(files, ADJANGO_FILE_CLEANUP_BATCH_SIZE):
+            Tasker.put(delete_files_task, files=serialize_files(batch))
+    else:
+        raise ImproperlyConfigured(
+            f'ADJANGO_FILE_CLEANUP_EXECUTOR must be one of {FILE_DELETION_EXECUTORS}, '
+            f'got {ADJANGO_FILE_CLEANUP_EXECUTOR!r}'
+        )
+
+
+def schedule_file_deletion(files: Iterable[tuple['FileField', str]], using: Optional[str] = None) -> None:
+    """
+    Deletes (field, name) files after the current transaction commits, see execute_file_deletion.
+
+    @usage: schedule_file_deletion([(Product._meta.get_field('image'), 'products/old.jpg')])
+    """
+    files = [(field, name) for field, name in files if name]
+    if files:
+        transaction.on_commit(lambda: execute_file_deletion(files), using=using)
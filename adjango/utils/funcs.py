@@ -1,16 +1,23 @@
 # utils/funcs.py
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import json
+from collections import defaultdict
 from functools import wraps
-from typing import Any, Iterable, Optional, TypeVar
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable, Optional, TypeVar
 from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
 
-from asgiref.sync import sync_to_async
+from asgiref.sync import SyncToAsync, sync_to_async
 from django.conf import settings
 from django.contrib.auth import REDIRECT_FIELD_NAME
-from django.core.exceptions import SynchronousOnlyOperation
+from django.core.exceptions import FieldDoesNotExist, SynchronousOnlyOperation
 from django.core.files.base import ContentFile
-from django.db.models import Manager, Model, QuerySet
+from django.db.models import ForeignKey, Manager, Model, Prefetch, Q, QuerySet, prefetch_related_objects
 from django.shortcuts import resolve_url
 
 from adjango.utils.base import download_file_to_temp
@@ -18,9 +25,95 @@ from adjango.utils.base import download_file_to_temp
 _M = TypeVar('_M', bound=Model)
 
 
+class RelatedLoader:
+    """
+    Coalesces concurrent forward ForeignKey/OneToOne loads into one IN query per field.
+
+    Loads requested within one event loop tick (e.g. from asyncio.gather) are collected
+    and resolved together; results are stored in each instance's field cache.
+    One loader exists per request (asgiref thread sensitive context) or per event loop,
+    so queries run in the same thread and transaction as the requesting code.
+    """
+
+    _loaders: WeakKeyDictionary = WeakKeyDictionary()
+
+    def __init__(self) -> None:
+        self._batches: dict[tuple[ForeignKey, str], dict[Any, list]] = {}
+
+    @classmethod
+    def current(cls) -> 'RelatedLoader':
+        scope = SyncToAsync.thread_sensitive_context.get(None) or asyncio.get_running_loop()
+        loader = cls._loaders.get(scope)
+        if loader is None:
+            loader = cls._loaders[scope] = cls()
+        return loader
+
+    def load(self, field: ForeignKey, obj: Model) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        key = (field, obj._state.db)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = defaultdict(list)
+            loop.call_soon(self._dispatch, key)
+        future = loop.create_future()
+        batch[getattr(obj, field.attname)].append((obj, future))
+        return future
+
+    def _dispatch(self, key: tuple[ForeignKey, str]) -> None:
+        asyncio.ensure_future(self._flush(*key, self._batches.pop(key)))
+
+    @staticmethod
+    def _fetch(field: ForeignKey, db: str, values: list[Any]) -> dict[Any, Model]:
+        target = field.target_field
+        queryset = field.remote_field.model._base_manager.db_manager(db).filter(**{f'{target.name}__in': values})
+        return {getattr(rel_obj, target.attname): rel_obj for rel_obj in queryset}
+
+    async def _flush(self, field: ForeignKey, db: str, batch: dict[Any, list]) -> None:
+        try:
+            related = await sync_to_async(self._fetch)(field, db, list(batch))
+        except Exception as e:
+            for waiters in batch.values():
+                for _, future in waiters:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for value, waiters in batch.items():
+            rel_obj = related.get(value)
+            for obj, future in waiters:
+                if future.done():
+                    continue
+                if rel_obj is None:
+                    descriptor = getattr(obj.__class__, field.name)
+                    future.set_exception(
+                        descriptor.RelatedObjectDoesNotExist(f'{obj.__class__.__name__} has no {field.name}.')
+                    )
+                    continue
+                field.set_cached_value(obj, rel_obj)
+                if field.one_to_one:
+                    field.remote_field.set_cached_value(rel_obj, obj)
+                future.set_result(rel_obj)
+
+
+def _batchable_field(obj: Model, field: str) -> Optional[ForeignKey]:
+    """Forward ForeignKey/OneToOne field whose value is loaded, or None."""
+    if not isinstance(obj, Model):
+        return None
+    try:
+        model_field = obj._meta.get_field(field)
+    except FieldDoesNotExist:
+        return None
+    # get_field() also resolves attname ('user_id'), which reads the raw value
+    if not isinstance(model_field, ForeignKey) or model_field.name != field or model_field.attname not in obj.__dict__:
+        return None
+    return model_field
+
+
 async def arelated(obj: Model, field: str) -> Model:
     """
     Async gets related object from model by specified related field name.
+    Concurrent calls for the same forward ForeignKey/OneToOne field are batched
+    into one IN query by RelatedLoader.
 
     :param obj: Model instance to get related object from.
     :param field: Name of related field to get object from.
@@ -28,7 +121,15 @@ async def arelated(obj: Model, field: str) -> Model:
     :return: Related object or None if field doesn't exist.
 
     @usage: result = await arelated(my_model_instance, "related_field_name")
+            users = await asyncio.gather(*(arelated(order, 'user') for order in orders))  # one query
     """
+    model_field = _batchable_field(obj, field)
+    if model_field is not None:
+        if model_field.is_cached(obj):
+            return model_field.get_cached_value(obj)
+        if getattr(obj, model_field.attname) is None:
+            return None
+        return await RelatedLoader.current().load(model_field, obj)
     try:
         value = getattr(obj, field)
         return value
@@ -38,6 +139,24 @@ async def arelated(obj: Model, field: str) -> Model:
         return await sync_to_async(getattr)(obj, field)
 
 
+async def arelated_many(instances: Iterable[_M], *lookups: str | Prefetch) -> list[_M]:
+    """
+    Async attaches related objects (ForeignKey, ManyToMany, reverse relations) to already
+    loaded instances via prefetch_related_objects in a single thread hop.
+
+    :param instances: Model instances, e.g. from cache or aall().
+    :param lookups: prefetch_related lookups or Prefetch objects.
+
+    :return: List of passed instances.
+
+    @usage: orders = await arelated_many(await aall(Order.objects), 'user', 'products')
+    """
+    instances = list(instances)
+    if instances:
+        await sync_to_async(prefetch_related_objects)(instances, *lookups)
+    return instances
+
+
 async def aset(related_manager: Manager[_M] | QuerySet[_M], data: Iterable[_M], *args, **kwargs) -> None:
     """
     Set related objects for ManyToMany field asynchronously.
@@ -93,6 +212,103 @@ async def afilter(queryset: QuerySet[_M], *args: Any, **kwargs: Any) -> list[_M]
     return await sync_to_async(lambda: list(queryset.filter(*args, **kwargs)))()
 
 
+async def aiter_chunks(objects: Manager[_M] | QuerySet[_M], chunk_size: int = 2000) -> AsyncIterator[list[_M]]:
+    """
+    Async iterates over QuerySet in lists of at most chunk_size objects.
+    Rows are pulled with iterator() (server-side cursor where supported),
+    so memory stays bounded regardless of the number of rows.
+
+    :param objects: Model manager or QuerySet to iterate over.
+    :param chunk_size: Maximum number of objects per yielded list.
+
+    :return: Async iterator of object lists.
+
+    @usage: async for chunk in aiter_chunks(MyModel.objects.filter(active=True), 500): ...
+    """
+    queryset = objects.all() if isinstance(objects, Manager) else objects
+    rows = queryset.iterator(chunk_size=chunk_size)
+    next_chunk = sync_to_async(lambda: list(islice(rows, chunk_size)))
+    try:
+        while chunk := await next_chunk():
+            yield chunk
+    finally:
+        # Close the cursor if iteration was stopped early
+        await sync_to_async(rows.close)()
+
+
+def _encode_cursor(values: list[Any]) -> str:
+    # isoformat keeps microseconds, unlike DjangoJSONEncoder
+    raw = json.dumps(values, default=lambda o: o.isoformat() if hasattr(o, 'isoformat') else str(o))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str, size: int) -> list[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError('Invalid cursor')
+    return values
+
+
+def _keyset_filter(ordering: tuple[str, ...], values: list[Any]) -> Q:
+    """
+    Expanded row comparison (a, b) > (x, y) -> a >= x AND (a > x OR (a = x AND b > y)),
+    with < for descending ('-field') parts. The redundant leading a >= x bound lets the
+    database use it as an index range instead of filtering the OR row by row.
+    """
+    condition = Q()
+    for index, field in enumerate(ordering):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        part = Q(**{f'{name}__{lookup}': values[index]})
+        for prev_field, prev_value in zip(ordering[:index], values[:index]):
+            part &= Q(**{prev_field.lstrip('-'): prev_value})
+        condition |= part
+    if len(ordering) > 1:
+        first = ordering[0]
+        lookup = 'lte' if first.startswith('-') else 'gte'
+        condition = Q(**{f'{first.lstrip("-")}__{lookup}': values[0]}) & condition
+    return condition
+
+
+async def akeyset_page(
+    queryset: Manager[_M] | QuerySet[_M],
+    ordering: tuple[str, ...] = ('created_at', 'pk'),
+    cursor: Optional[str] = None,
+    page_size: int = 50,
+) -> tuple[list[_M], Optional[str]]:
+    """
+    Async returns one page of keyset (seek) pagination and cursor of the next page.
+    Unlike OFFSET, every page is a WHERE (created_at, pk) > (...) query served by the index,
+    so deep pages cost the same as the first one.
+
+    :param queryset: Model manager or QuerySet to paginate.
+    :param ordering: Local non-nullable fields to order by, '-field' for descending.
+                     pk is appended if missing, so the order is total.
+    :param cursor: Opaque cursor returned for the previous page, None for the first page.
+    :param page_size: Number of objects per page.
+
+    :return: Tuple of page objects and next page cursor (None on the last page).
+
+    @usage: orders, cursor = await akeyset_page(Order.objects.filter(user=user), ('-created_at', '-pk'), cursor)
+    """
+    if ordering[-1].lstrip('-') not in ('pk', queryset.model._meta.pk.name):
+        ordering = (*ordering, '-pk' if ordering[-1].startswith('-') else 'pk')
+    queryset = queryset.all() if isinstance(queryset, Manager) else queryset
+    if cursor is not None:
+        queryset = queryset.filter(_keyset_filter(ordering, _decode_cursor(cursor, len(ordering))))
+    queryset = queryset.order_by(*ordering)
+
+    page = await sync_to_async(lambda: list(queryset[: page_size + 1]))()
+    if len(page) <= page_size:
+        return page, None
+    page = page[:page_size]
+    last = page[-1]
+    return page, _encode_cursor([last.serializable_value(field.lstrip('-')) for field in ordering])
+
+
 def auser_passes_test(
     test_func: Any,
     login_url: Optional[str] = None,
@@ -51,6 +51,14 @@ class Product(PolymorphicModel, CreatedAtMixin):
     def service(self) -> ProductService: return ProductService(self)
 
 
+class Book(Product):
+    author = CharField(max_length=100)
+
+
+class Gadget(Product):
+    brand = CharField(max_length=100)
+
+
 class Post(Model):
     title = CharField(max_length=100)
     content = CharField(max_length=255)
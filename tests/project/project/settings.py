@@ -49,6 +49,7 @@ LOGIN_URL = '/login/'
 ADJANGO_UNCAUGHT_EXCEPTION_HANDLING_FUNCTION = _dummy_handler
 ADJANGO_IP_LOGGER = 'global'
 ADJANGO_IP_META_NAME = 'HTTP_X_FORWARDED_FOR'
+ADJANGO_GETORN_CACHE_ALIAS = 'default'
 
 # For copy_project manage.py command
 COPY_PROJECT_CONFIGURATIONS = BASE_DIR / 'project' / 'copy_conf.py'
@@ -7,7 +7,7 @@ try:
     from django.contrib.auth.models import User
     from rest_framework import status
     from rest_framework.exceptions import APIException
-    from rest_framework.serializers import ModelSerializer, Serializer
+    from rest_framework.serializers import ModelSerializer, Serializer, SerializerMethodField
 
     DRF_AVAILABLE = True
 except ImportError:
@@ -23,6 +23,69 @@ from adjango.aserializers import (
     SerializerErrors,
     serializer_errors_to_field_errors,
 )
+from app.models import Order, Post, Product
+from app.models import User as AppUser
+
+
+class PostSerializer(AModelSerializer):
+    class Meta:
+        model = Post
+        fields = ('id', 'title')
+
+
+class UserSerializer(AModelSerializer):
+    class Meta:
+        model = AppUser
+        fields = ('id', 'username', 'is_active')
+
+
+class UserWriteSerializer(AModelSerializer):
+    class Meta:
+        model = AppUser
+        fields = ('id', 'username', 'phone')
+
+
+class OrderSerializer(AModelSerializer):
+    user = UserSerializer(read_only=True)
+
+    class Meta:
+        model = Order
+        fields = ('id', 'user')
+
+
+class ProductSerializer(AModelSerializer):
+    class Meta:
+        model = Product
+        fields = ('id', 'name', 'price', 'created_at', 'polymorphic_ctype')
+
+
+class OrderDetailSerializer(AModelSerializer):
+    owner = UserSerializer(source='user', read_only=True)
+    label = SerializerMethodField()
+
+    class Meta:
+        model = Order
+        fields = ('id', 'user', 'owner', 'products', 'label')
+
+    def get_label(self, obj):
+        return f'Order {obj.pk}'
+
+
+class CompiledUserSerializer(UserSerializer):
+    class Meta(UserSerializer.Meta):
+        compiled = True
+
+
+class CompiledProductSerializer(ProductSerializer):
+    class Meta(ProductSerializer.Meta):
+        compiled = True
+
+
+class CompiledOrderDetailSerializer(OrderDetailSerializer):
+    owner = CompiledUserSerializer(source='user', read_only=True)
+
+    class Meta(OrderDetailSerializer.Meta):
+        compiled = True
 
 
 @pytest.mark.skipif(not DRF_AVAILABLE, reason='Django REST Framework not available')
@@ -57,6 +120,16 @@ class TestFieldErrorsFunction:
         assert len(result) == 1
         assert result[0] == FieldError(field='username', message='This field is required')
 
+    def test_serializer_errors_to_field_errors_list_serializer(self):
+        """Test list and index-keyed errors of list serializers get dotted fields"""
+        expected = [
+            FieldError(field='1.name', message='Required'),
+            FieldError(field='1.tags.0', message='Invalid'),
+        ]
+
+        assert serializer_errors_to_field_errors([{}, {'name': ['Required'], 'tags': {0: ['Invalid']}}]) == expected
+        assert serializer_errors_to_field_errors({1: {'name': ['Required'], 'tags': {0: ['Invalid']}}}) == expected
+
 
 @pytest.mark.skipif(not DRF_AVAILABLE, reason='Django REST Framework not available')
 class TestDetailAPIException:
@@ -133,33 +206,362 @@ class TestAListSerializer:
 
     @pytest.mark.asyncio
     async def test_adata_property(self):
-        """Test async data property"""
-        from unittest.mock import PropertyMock
+        """Test async data property renders all items with the shared child"""
+        child_mock = MagicMock()
+        child_mock.to_representation.side_effect = lambda item: {'id': item, 'name': 'Test'}
 
-        # Create mock child serializer
-        child_serializer_class = MagicMock()
-        child_instance = MagicMock()
+        serializer = AListSerializer(child=child_mock, context={})
+        serializer.instance = [1, 2]
 
-        # Create AsyncMock for adata property that returns coroutine
-        async def mock_adata():
-            return {'id': 1, 'name': 'Test'}
+        result = await serializer.adata
 
-        type(child_instance).adata = PropertyMock(return_value=mock_adata())
-        child_serializer_class.return_value = child_instance
+        assert result == [{'id': 1, 'name': 'Test'}, {'id': 2, 'name': 'Test'}]
+        assert child_mock.to_representation.call_count == 2
 
-        # Create mock data
-        mock_data = [MagicMock(), MagicMock()]
+    @pytest.mark.asyncio
+    async def test_adata_single_thread_hop(self):
+        """Test that the whole list is rendered in one sync_to_async call"""
+        from asgiref.sync import sync_to_async
 
-        # Create AListSerializer with child
         child_mock = MagicMock()
-        child_mock.__class__ = child_serializer_class
+        child_mock.to_representation.side_effect = lambda item: {'id': item}
+
         serializer = AListSerializer(child=child_mock, context={})
-        serializer.instance = mock_data
+        serializer.instance = list(range(50))
 
-        result = await serializer.adata
+        with patch('adjango.aserializers.sync_to_async', wraps=sync_to_async) as mock_sync_to_async:
+            result = await serializer.adata
+
+        assert len(result) == 50
+        mock_sync_to_async.assert_called_once()
+
+
+@pytest.mark.skipif(not DRF_AVAILABLE, reason='Django REST Framework not available')
+class TestAListSerializerStream:
+    """Tests for AListSerializer.astream and StreamingJSONResponse"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_astream_matches_adata(self):
+        """Test that streamed fragments form the same JSON as adata"""
+        import json
+
+        for i in range(5):
+            await Post.objects.acreate(title=f't{i}', content='c', image='i')
+
+        fragments = [f async for f in PostSerializer(Post.objects.order_by('id'), many=True).astream(chunk_size=2)]
+        expected = await PostSerializer(Post.objects.order_by('id'), many=True).adata
+
+        # '[' + 3 chunks + ']'
+        assert len(fragments) == 5
+        assert json.loads(''.join(fragments)) == json.loads(json.dumps(expected))
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_astream_empty(self):
+        """Test streaming an empty queryset"""
+        serializer = PostSerializer(Post.objects.all(), many=True)
+
+        assert ''.join([f async for f in serializer.astream()]) == '[]'
+
+    @pytest.mark.asyncio
+    async def test_astream_plain_list(self):
+        """Test streaming a plain list of items"""
+        child_mock = MagicMock()
+        child_mock.to_representation.side_effect = lambda item: {'id': item}
+        serializer = AListSerializer(child=child_mock, context={})
+        serializer.instance = [1, 2, 3]
+
+        assert ''.join([f async for f in serializer.astream(chunk_size=2)]) == '[{"id":1},{"id":2},{"id":3}]'
 
-        assert len(result) == 2
-        assert child_serializer_class.call_count == 2
+    @pytest.mark.asyncio
+    async def test_streaming_json_response(self):
+        """Test streaming response wraps astream output"""
+        from adjango.aserializers import StreamingJSONResponse
+
+        child_mock = MagicMock()
+        child_mock.to_representation.side_effect = lambda item: {'id': item}
+        serializer = AListSerializer(child=child_mock, context={})
+        serializer.instance = [1, 2]
+
+        response = StreamingJSONResponse(serializer, chunk_size=1, status=201)
+
+        assert response['Content-Type'] == 'application/json'
+        assert response.status_code == 201
+        content = b''.join([chunk async for chunk in response.streaming_content])
+        assert content == b'[{"id":1},{"id":2}]'
+
+
+@pytest.mark.skipif(not DRF_AVAILABLE, reason='Django REST Framework not available')
+class TestQueryPatternDetector:
+    """Tests for N+1 query detection"""
+
+    @staticmethod
+    def _create_orders(count):
+        for i in range(count):
+            Order.objects.create(user=AppUser.objects.create(username=f'n{i}', phone=f'n{i}'))
+
+    def test_normalize_sql(self):
+        """Test that values and IN lists are collapsed"""
+        from adjango.aserializers import normalize_sql
+
+        assert normalize_sql('SELECT * FROM "t2" WHERE "id" IN (%s, %s, %s) AND x = 5') == (
+            'SELECT * FROM "t2" WHERE "id" IN (...) AND x = ?'
+        )
+        assert normalize_sql("SELECT 'a''b'") == 'SELECT ?'
+
+    @pytest.mark.django_db
+    def test_detects_repeated_query_with_field(self):
+        """Test that per-row relation access is reported with the field name"""
+        from adjango.aserializers import NPlusOneError, QueryPatternDetector
+
+        self._create_orders(3)
+
+        with pytest.raises(NPlusOneError, match="repeated 3 times by field 'user'"):
+            with QueryPatternDetector(threshold=2, raise_exception=True):
+                OrderSerializer(Order.objects.all(), many=True).data
+
+    @pytest.mark.django_db
+    def test_no_report_with_select_related(self):
+        """Test that optimized queryset passes the check"""
+        from adjango.aserializers import QueryPatternDetector
+
+        self._create_orders(3)
+
+        with QueryPatternDetector(threshold=1, raise_exception=True) as detector:
+            OrderSerializer(Order.objects.select_related('user'), many=True).data
+
+        assert detector.repeated == []
+        assert sum(detector.counts.values()) == 1
+
+    @pytest.mark.django_db
+    def test_settings_enable_warning(self, monkeypatch):
+        """Test that ADJANGO_SERIALIZER_QUERY_THRESHOLD enables check in data"""
+        from adjango import conf
+        from adjango.aserializers import NPlusOneWarning
+
+        monkeypatch.setattr(conf, 'ADJANGO_SERIALIZER_QUERY_THRESHOLD', 2)
+        self._create_orders(3)
+
+        with pytest.warns(NPlusOneWarning, match='OrderSerializer\\(many=True\\)'):
+            OrderSerializer(Order.objects.all(), many=True).data
+
+    @pytest.mark.django_db
+    def test_disabled_by_default(self, recwarn):
+        """Test that check is off without settings"""
+        self._create_orders(3)
+
+        OrderSerializer(Order.objects.all(), many=True).data
+
+        assert not recwarn.list
+
+
+@pytest.mark.skipif(not DRF_AVAILABLE, reason='Django REST Framework not available')
+class TestCompiledRepresentation:
+    """Tests for Meta.compiled fast path of AModelSerializer"""
+
+    @staticmethod
+    def _create_data():
+        for i in range(2):
+            order = Order.objects.create(user=AppUser.objects.create(username=f'c{i}', phone=f'c{i}'))
+            order.products.add(Product.objects.create(name=f'p{i}', price='1.50'))
+
+    @pytest.mark.django_db
+    def test_output_matches_generic_path(self):
+        """Test compiled output equals DRF output"""
+        self._create_data()
+        querysets = (Product.objects.order_by('id'), Order.objects.order_by('id'))
+        generic = [s(q, many=True).data for s, q in zip((ProductSerializer, OrderDetailSerializer), querysets)]
+        compiled = [
+            s(q, many=True).data for s, q in zip((CompiledProductSerializer, CompiledOrderDetailSerializer), querysets)
+        ]
+
+        assert compiled == generic
+        assert compiled[1][0]['owner']['username'] == 'c0'
+        assert compiled[1][0]['label'].startswith('Order ')
+
+    def test_non_model_instance_uses_generic_path(self):
+        """Test that dicts (e.g. validated_data) are rendered by DRF"""
+        data = {'id': 1, 'name': 'p', 'price': '1.50', 'created_at': None, 'polymorphic_ctype': None}
+        assert CompiledProductSerializer(data).data == ProductSerializer(data).data
+        assert CompiledProductSerializer(data).data['price'] == '1.50'
+
+    def test_custom_fields_use_generic_path(self):
+        """Test that custom to_representation, source='*' and method sources disable the plan"""
+        from rest_framework.fields import CharField as DRFCharField
+        from rest_framework.fields import Field
+
+        class UpperField(DRFCharField):
+            def to_representation(self, value):
+                return value.upper()
+
+        class WholeField(Field):
+            def to_representation(self, value):
+                return f'{value.name}:{value.price}'
+
+        class UpperSerializer(AModelSerializer):
+            name = UpperField()
+
+            class Meta:
+                model = Product
+                fields = ('id', 'name')
+                compiled = True
+
+        class WholeSerializer(AModelSerializer):
+            whole = WholeField(source='*', read_only=True)
+            text = DRFCharField(source='__str__', read_only=True)
+
+            class Meta:
+                model = Product
+                fields = ('id', 'whole', 'text')
+                compiled = True
+
+        product = Product(id=1, name='p', price='1.50')
+
+        assert UpperSerializer(product).data == {'id': 1, 'name': 'P'}
+        assert UpperSerializer(product)._compiled_fields() is None
+        assert WholeSerializer(product).data == {'id': 1, 'whole': 'p:1.50', 'text': str(product)}
+        assert WholeSerializer(product)._compiled_fields() is None
+
+    @pytest.mark.django_db
+    def test_plan_cached_per_class(self):
+        """Test that the plan is built once per class"""
+        self._create_data()
+
+        CompiledOrderDetailSerializer(Order.objects.all(), many=True).data
+        plan = CompiledOrderDetailSerializer.__dict__['_compiled_plan']
+        CompiledOrderDetailSerializer(Order.objects.all(), many=True).data
+
+        assert CompiledOrderDetailSerializer.__dict__['_compiled_plan'] is plan
+        assert dict((name, attname) for name, attname, _ in plan) == {
+            'id': 'id',
+            'user': 'user_id',
+            'owner': None,
+            'products': None,
+            'label': None,
+        }
+
+    @pytest.mark.django_db
+    def test_detector_reports_field_of_compiled_serializer(self):
+        """Test that N+1 detection still names the field"""
+        from adjango.aserializers import NPlusOneError, QueryPatternDetector
+
+        self._create_data()
+
+        with pytest.raises(NPlusOneError, match="by field 'owner'"):
+            with QueryPatternDetector(threshold=1, raise_exception=True):
+                CompiledOrderDetailSerializer(Order.objects.all(), many=True).data
+
+
+@pytest.mark.skipif(not DRF_AVAILABLE, reason='Django REST Framework not available')
+class TestABulkListSerializer:
+    """Tests for bulk=True list serializer"""
+
+    def test_many_init_bulk(self):
+        """Test bulk=True selects ABulkListSerializer"""
+        from adjango.aserializers import ABulkListSerializer
+
+        serializer = UserWriteSerializer(data=[], many=True, bulk=True)
+
+        assert isinstance(serializer, ABulkListSerializer)
+
+    @pytest.mark.django_db
+    def test_bulk_create_batches_queries(self):
+        """Test one unique check per field and one INSERT for the whole list"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        payload = [{'username': f'b{i}', 'phone': f'b{i}'} for i in range(5)]
+        serializer = UserWriteSerializer(data=payload, many=True, bulk=True)
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert serializer.is_valid()
+            users = serializer.save()
+
+        sqls = [q['sql'] for q in ctx.captured_queries]
+        assert len([sql for sql in sqls if sql.startswith('SELECT')]) == 2
+        assert len([sql for sql in sqls if sql.startswith('INSERT')]) == 1
+        assert [u.username for u in users] == [f'b{i}' for i in range(5)]
+        assert AppUser.objects.filter(username__startswith='b').count() == 5
+
+    @pytest.mark.django_db
+    def test_bulk_unique_errors(self):
+        """Test conflicts with stored rows and inside payload are reported per item"""
+        AppUser.objects.create(username='taken', phone='u0')
+        payload = [
+            {'username': 'taken', 'phone': 'u1'},
+            {'username': 'free', 'phone': 'u2'},
+            {'username': 'dup', 'phone': 'u3'},
+            {'username': 'dup', 'phone': 'u4'},
+        ]
+        serializer = UserWriteSerializer(data=payload, many=True, bulk=True)
+
+        assert not serializer.is_valid()
+        errors = serializer.errors
+        errors = errors if isinstance(errors, list) else [errors.get(i, {}) for i in range(4)]
+        assert list(errors[0]) == ['username']
+        assert errors[0]['username'][0].code == 'unique'
+        assert errors[1] == {} and errors[2] == {}
+        assert list(errors[3]) == ['username']
+
+    @pytest.mark.django_db
+    def test_bulk_update_by_position(self):
+        """Test bulk update ignores own row in unique check and saves with bulk_update"""
+        users = [AppUser.objects.create(username=f'up{i}', phone=f'up{i}') for i in range(3)]
+        payload = [{'username': f'up{i}', 'phone': f'new{i}'} for i in range(3)]
+        serializer = UserWriteSerializer(users, data=payload, many=True, bulk=True)
+
+        assert serializer.is_valid(), serializer.errors
+        serializer.save()
+
+        assert sorted(AppUser.objects.filter(username__startswith='up').values_list('phone', flat=True)) == [
+            'new0',
+            'new1',
+            'new2',
+        ]
+
+    @pytest.mark.django_db
+    def test_bulk_update_length_mismatch(self):
+        """Test that update requires one data item per instance"""
+        users = [AppUser.objects.create(username='len0', phone='len0')]
+        serializer = UserWriteSerializer(users, data=[], many=True, bulk=True)
+
+        assert not serializer.is_valid()
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_bulk_async_with_many_to_many(self):
+        """Test ais_valid/asave and many-to-many assignment after bulk_create"""
+        class OrderWriteSerializer(AModelSerializer):
+            class Meta:
+                model = Order
+                fields = ('id', 'user', 'products')
+
+        user = await AppUser.objects.acreate(username='m2m', phone='m2m')
+        product = await Product.objects.acreate(name='p', price=1)
+        payload = [{'user': user.pk, 'products': [product.pk]} for _ in range(2)]
+        serializer = OrderWriteSerializer(data=payload, many=True, bulk=True)
+
+        assert await serializer.ais_valid(raise_exception=True)
+        orders = await serializer.asave()
+
+        assert len(orders) == 2
+        assert await Order.objects.filter(products=product).acount() == 2
+
+    @pytest.mark.parametrize('bulk', [True, False])
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_ais_valid_raise_exception_flattens_item_errors(self, bulk):
+        """Test list errors are reported per item field"""
+        await AppUser.objects.acreate(username='taken', phone='t0')
+        payload = [{'username': 'free', 'phone': 't1'}, {'username': 'taken', 'phone': 't2'}]
+        serializer = UserWriteSerializer(data=payload, many=True, bulk=bulk)
+
+        with pytest.raises(SerializerErrors) as exc_info:
+            await serializer.ais_valid(raise_exception=True)
+
+        fields_errors = exc_info.value.detail['fields_errors']
+        assert [error['field'] for error in fields_errors] == ['1.username']
 
 
 @pytest.mark.skipif(not DRF_AVAILABLE, reason='Django REST Framework not available')
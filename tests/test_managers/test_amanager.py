@@ -0,0 +1,116 @@
+import pytest
+
+from adjango.managers import AManager
+from adjango.querysets import AQuerySet
+
+
+def test_model_default_manager():
+    from app.models import Order, Post
+
+    assert isinstance(Post.objects, AManager)
+    assert isinstance(Order.objects.all(), AQuerySet)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_aall_afilter_agetorn():
+    from app.models import Post
+
+    p1 = await Post.objects.acreate(title='a', content='c', image='i')
+    p2 = await Post.objects.acreate(title='b', content='c', image='i')
+
+    assert await Post.objects.order_by('pk').aall() == [p1, p2]
+    assert await Post.objects.afilter(title='b') == [p2]
+    assert await Post.objects.agetorn(title='a') == p1
+    assert await Post.objects.agetorn(title='missing') is None
+
+    class MyError(Exception):
+        pass
+
+    with pytest.raises(MyError):
+        await Post.objects.agetorn(MyError, title='missing')
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_aall_uses_prefetched_cache():
+    from app.models import Order, Role, User
+
+    user = await User.objects.acreate(username='am', phone='am')
+    role = await Role.objects.acreate(name=Role.Variant.ORGANIZER)
+    await user.roles.aadd(role)
+    order = await Order.objects.acreate(user=user)
+
+    fetched = (await Order.objects.select_related('user').prefetch_related('user__roles').afilter(pk=order.pk))[0]
+    queryset = fetched.user.roles.all()
+
+    assert queryset._result_cache is not None
+    assert await queryset.aall() == [role]
+    assert await fetched.user.roles.aall() == [role]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_abulk_upsert():
+    from app.models import Role
+
+    org = await Role.objects.acreate(name=Role.Variant.ORGANIZER)
+
+    # Nothing to update besides the unique field: conflicts are ignored
+    await Role.objects.abulk_upsert(
+        [Role(name=Role.Variant.ORGANIZER), Role(name=Role.Variant.EVENT_MEMBER)],
+        unique_fields=['name'],
+    )
+    assert await Role.objects.acount() == 2
+
+    await Role.objects.filter(name=Role.Variant.EVENT_MEMBER).adelete()
+    await Role.objects.abulk_upsert([Role(id=org.id, name=Role.Variant.EVENT_MEMBER)], unique_fields=['id'])
+    assert (await Role.objects.aget(pk=org.pk)).name == Role.Variant.EVENT_MEMBER
+
+
+@pytest.mark.asyncio
+async def test_abulk_upsert_without_conflict_target(monkeypatch):
+    from django.db import connection
+
+    from app.models import Role
+
+    calls = []
+
+    async def abulk_create(self, objs, **kwargs):
+        calls.append(kwargs)
+        return objs
+
+    monkeypatch.setattr(type(connection.features), 'supports_update_conflicts_with_target', False)
+    monkeypatch.setattr(AQuerySet, 'abulk_create', abulk_create)
+
+    await Role.objects.abulk_upsert([Role(id=1, name=Role.Variant.ORGANIZER)], unique_fields=['id'])
+
+    assert calls[0]['unique_fields'] is None
+    assert calls[0]['update_fields'] == ['name']
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_abulk_upsert_polymorphic_keeps_created_at_and_type():
+    from app.models import Book, Product
+
+    book = await Book.objects.acreate(name='b', price=1, author='a')
+
+    await Product.objects.abulk_upsert([Product(id=book.pk, name='renamed', price=2)], unique_fields=['id'])
+
+    fresh = await Product.objects.aget(pk=book.pk)
+    assert isinstance(fresh, Book)
+    assert fresh.name == 'renamed' and fresh.created_at == book.created_at
+    assert await Product.objects.acount() == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_aiter_chunks():
+    from app.models import Post
+
+    for i in range(3):
+        await Post.objects.acreate(title=f't{i}', content='c', image='i')
+
+    chunks = [chunk async for chunk in Post.objects.order_by('pk').aiter_chunks(2)]
+    assert [len(chunk) for chunk in chunks] == [2, 1]
@@ -212,6 +212,36 @@ class TestAChoicesMixin:
 
         assert Status.as_dict() == {'new': 'New', 'done': 'Done'}
 
+    def test_lookup_tables_computed_once_per_class(self):
+        class Status(ATextChoices):
+            NEW = 'new', 'New'
+            DONE = 'done', 'Done'
+
+        class Other(ATextChoices):
+            NEW = 'new', 'Other new'
+
+        assert Status.get_label('new') == 'New'
+        tables = Status.__dict__['_achoices_tables']
+        assert Status.has_value('done') and Status.as_dict() == {'new': 'New', 'done': 'Done'}
+        assert Status.__dict__['_achoices_tables'] is tables
+        assert Other.get_label('new') == 'Other new'
+
+        # as_dict returns a copy, tables stay frozen
+        Status.as_dict()['new'] = 'Changed'
+        assert Status.get_label('new') == 'New'
+        with pytest.raises(TypeError):
+            tables[0]['new'] = 'Changed'
+
+    def test_labels_for(self):
+        class Status(ATextChoices):
+            NEW = 'new', 'New'
+            DONE = 'done', 'Done'
+
+        assert Status.labels_for(['done', 'new', 'missing', Status.NEW]) == ['Done', 'New', None, 'New']
+        assert Status.labels_for(iter(['new']), default='-') == ['New']
+        assert Status.labels_for(['new', [], None], default='-') == ['New', '-', '-']
+        assert Status.labels_for([]) == []
+
     def test_values_and_labels_still_available_from_django_choices(self):
         class Status(ATextChoices):
             NEW = 'new', 'New'
@@ -221,6 +251,25 @@ class TestAChoicesMixin:
         assert Status.labels == ['New', 'Done']
 
 
+@pytest.mark.django_db
+def test_as_case_annotates_labels_in_sql():
+    from app.models import Role
+
+    Role.objects.create(name=Role.Variant.ORGANIZER)
+    Role.objects.create(name=Role.Variant.EVENT_MEMBER)
+    Role.objects.create(name='legacy')
+
+    roles = Role.objects.annotate(label=Role.Variant.as_case('name', default='Unknown')).order_by('label')
+
+    assert list(roles.values_list('name', 'label')) == [
+        ('event_member', 'Event member'),
+        ('org', 'Organizer'),
+        ('legacy', 'Unknown'),
+    ]
+    assert list(roles.filter(label='Organizer').values_list('name', flat=True)) == ['org']
+    assert Role.objects.annotate(label=Role.Variant.as_case('name')).get(name='legacy').label is None
+
+
 class TestAIntegerChoices:
     def test_ainteger_choices_inheritance(self):
         assert issubclass(AIntegerChoices, IntegerChoices)
@@ -252,6 +301,18 @@ class TestAIntegerChoices:
 
         assert Priority.as_dict() == {1: 'Low', 2: 'High'}
 
+    def test_as_case_for_integer_choices(self):
+        class Priority(AIntegerChoices):
+            LOW = 1, 'Low'
+            HIGH = 2, 'High'
+
+        case = Priority.as_case('priority')
+        assert [(when.condition.children, when.result.value) for when in case.cases] == [
+            ([('priority', 1)], 'Low'),
+            ([('priority', 2)], 'High'),
+        ]
+        assert case.default.value is None
+
     def test_values_and_labels_still_available_from_django_integer_choices(self):
         class Priority(AIntegerChoices):
             LOW = 1, 'Low'
@@ -1,6 +1,12 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
 import pytest
+from django.core.files.storage import FileSystemStorage
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
 
 from adjango.models.mixins import FileCleanupMixin
 
@@ -37,6 +43,16 @@ class CleanupDisabledModel(FileCleanupMixin):
         app_label = 'test_file_cleanup'
 
 
+class SweepStorageModel(models.Model):
+    # Separate storage instances with the same location are swept together
+    first = models.FileField(storage=FileSystemStorage())
+    second = models.FileField(storage=FileSystemStorage())
+    other = models.FileField(storage=FileSystemStorage(location='other_media'))
+
+    class Meta:
+        app_label = 'test_file_cleanup'
+
+
 class CleanupSelectiveModel(FileCleanupMixin):
     file1 = models.FileField(upload_to='cleanup/', blank=True, null=True)
     file2 = models.FileField(upload_to='cleanup/', blank=True, null=True)
@@ -50,6 +66,25 @@ class CleanupSelectiveModel(FileCleanupMixin):
         app_label = 'test_file_cleanup'
 
 
+def test_file_cleanup_plan_built_per_class():
+    plan = CleanupCustomModel.__dict__['_file_cleanup']
+
+    assert [field.name for field in plan['fields']] == ['file1', 'file2', 'image']
+    assert [field.name for field in plan['on_replace']] == ['file1']
+    assert [field.name for field in plan['on_delete']] == ['file1', 'file2']
+    assert CleanupDisabledModel._file_cleanup_plan()['on_delete'] == ()
+    assert CleanupCustomModel._field_policy('file2') == {'enabled': True, 'on_replace': False, 'on_delete': True}
+
+
+def test_file_cleanup_invalid_config_fails_on_class_creation():
+    with pytest.raises(TypeError, match='on_delete'):
+        class CleanupInvalidModel(FileCleanupMixin):
+            FILE_CLEANUP = {'missing': {'on_delete': 'yes'}}
+
+            class Meta:
+                app_label = 'test_file_cleanup'
+
+
 def _upload(name: str, content: bytes = b'data') -> SimpleUploadedFile:
     return SimpleUploadedFile(name, content)
 
@@ -180,3 +215,197 @@ def test_file_cleanup_selective_enable_with_star_default():
 
     assert storage.exists(new_file1)         # disabled
     assert not storage.exists(new_file2)     # enabled
+
+
+@pytest.mark.django_db(transaction=True)
+def test_file_cleanup_replace_uses_loaded_names_without_select():
+    created = CleanupDefaultModel.objects.create(file1=_upload('snap_old.txt'))
+    storage = created._meta.get_field('file1').storage
+    old_file = created.file1.name
+
+    obj = CleanupDefaultModel.objects.get(pk=created.pk)
+    obj.file1 = _upload('snap_new.txt')
+    with CaptureQueriesContext(connection) as ctx:
+        obj.save()
+    assert not any(query['sql'].startswith('SELECT') for query in ctx.captured_queries)
+    assert not storage.exists(old_file)
+
+    # Snapshot follows saves, so the next replace deletes the right file
+    new_file = obj.file1.name
+    obj.file1 = _upload('snap_newer.txt')
+    obj.save()
+    assert not storage.exists(new_file)
+
+    # update_fields without the file field leaves it alone
+    newer_file = obj.file1.name
+    obj.file1 = _upload('snap_skipped.txt', b'skipped')
+    obj.save(update_fields=['image'])
+    assert storage.exists(newer_file)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_file_cleanup_replace_falls_back_to_select():
+    created = CleanupDefaultModel.objects.create(file1=_upload('fallback_old.txt'))
+    storage = created._meta.get_field('file1').storage
+    old_file = created.file1.name
+
+    obj = CleanupDefaultModel(pk=created.pk, file1=_upload('fallback_new.txt'))
+    with CaptureQueriesContext(connection) as ctx:
+        obj.save()
+    assert any(query['sql'].startswith('SELECT') for query in ctx.captured_queries)
+    assert not storage.exists(old_file)
+
+    deferred = CleanupDefaultModel.objects.defer('file1').get(pk=created.pk)
+    current_file = deferred.file1.name
+    deferred.refresh_from_db(fields=['file1'])
+    deferred.file1 = _upload('fallback_newer.txt')
+    deferred.save()
+    assert not storage.exists(current_file)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_file_cleanup_bulk_delete():
+    objs = [CleanupCustomModel.objects.create(file1=_upload(f'bulk_{i}.txt'), image=_upload(f'bulk_{i}.jpg', b'jpeg'))
+            for i in range(3)]
+    storage = objs[0]._meta.get_field('file1').storage
+
+    with CaptureQueriesContext(connection) as ctx:
+        CleanupCustomModel.objects.filter(pk__in=[obj.pk for obj in objs[:2]]).delete()
+    assert sum(query['sql'].startswith('SELECT') for query in ctx.captured_queries) <= 2
+
+    assert not storage.exists(objs[0].file1.name)
+    assert not storage.exists(objs[1].file1.name)
+    assert storage.exists(objs[0].image.name)  # image cleanup disabled
+    assert storage.exists(objs[2].file1.name)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_file_cleanup_bulk_update_and_update():
+    first = CleanupDefaultModel.objects.create(file1=_upload('bu_first.txt'))
+    second = CleanupDefaultModel.objects.create(file1=_upload('bu_second.txt'))
+    storage = first._meta.get_field('file1').storage
+    old_first, old_second = first.file1.name, second.file1.name
+    kept = storage.save('cleanup/bu_kept.txt', _upload('bu_kept.txt'))
+
+    first.file1 = kept
+    CleanupDefaultModel.objects.bulk_update([first, second], ['file1'])
+    assert not storage.exists(old_first)
+    assert storage.exists(old_second)  # unchanged
+
+    CleanupDefaultModel.objects.filter(pk=second.pk).update(file1=kept)
+    assert not storage.exists(old_second)
+    assert storage.exists(kept)
+
+    CleanupDefaultModel.objects.update(file1=None)
+    assert not storage.exists(kept)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_file_cleanup_thread_executor(monkeypatch):
+    from adjango.utils import files
+
+    pool = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr('adjango.conf.ADJANGO_FILE_CLEANUP_EXECUTOR', 'thread')
+    monkeypatch.setattr(files, '_thread_pool', pool)
+
+    obj = CleanupDefaultModel.objects.create(file1=_upload('thread.txt'), image=_upload('thread.jpg', b'jpeg'))
+    storage = obj._meta.get_field('file1').storage
+    names = [obj.file1.name, obj.image.name]
+    obj.delete()
+    pool.shutdown(wait=True)
+
+    assert not any(storage.exists(name) for name in names)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_file_cleanup_celery_executor_batches(monkeypatch):
+    from adjango.utils.celery.tasker import Tasker
+
+    calls = []
+
+    def put(task, **kwargs):
+        calls.append(kwargs['files'])
+        return task.apply(kwargs=kwargs).id
+
+    monkeypatch.setattr('adjango.conf.ADJANGO_FILE_CLEANUP_EXECUTOR', 'celery')
+    monkeypatch.setattr('adjango.conf.ADJANGO_FILE_CLEANUP_BATCH_SIZE', 3)
+    monkeypatch.setattr(Tasker, 'put', staticmethod(put))
+
+    objs = [CleanupCustomModel.objects.create(file1=_upload(f'celery_{i}.txt'), file2=_upload(f'celery_{i}_2.txt'))
+            for i in range(2)]
+    storage = objs[0]._meta.get_field('file1').storage
+    names = [name for obj in objs for name in (obj.file1.name, obj.file2.name)]
+    CleanupCustomModel.objects.filter(pk__in=[obj.pk for obj in objs]).delete()
+
+    assert [len(batch) for batch in calls] == [3, 1]
+    assert calls[0][0][:2] == ['test_file_cleanup.CleanupCustomModel', 'file1']
+    assert not any(storage.exists(name) for name in names)
+
+
+def test_delete_files_task_retries_setting(monkeypatch):
+    from adjango.tasks import delete_files_task
+    from adjango.utils import files
+
+    attempts = []
+
+    def delete_files(batch):
+        attempts.append(batch)
+        return batch
+
+    monkeypatch.setattr('adjango.conf.ADJANGO_FILE_CLEANUP_RETRIES', 1)
+    monkeypatch.setattr(files, 'delete_files', delete_files)
+
+    batch = [['test_file_cleanup.CleanupDefaultModel', 'file1', 'gone.txt']]
+    delete_files_task.apply(kwargs={'files': batch}, throw=False)
+
+    assert len(attempts) == 2
+    assert attempts[-1][0][1] == 'gone.txt'
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sweepmedia_reports_deletes_and_resumes(monkeypatch, tmp_path):
+    from django.core.management import call_command
+
+    from adjango.management.commands.sweepmedia import Command
+
+    obj = CleanupDefaultModel.objects.create(file1=_upload('sweep_kept.txt'))
+    storage = obj._meta.get_field('file1').storage
+    orphans = [storage.save(name, _upload('orphan.txt')) for name in ('a/orphan.txt', 'cleanup/z_orphan.txt')]
+    fields = [(CleanupDefaultModel, CleanupDefaultModel._meta.get_field(name)) for name in ('file1', 'image')]
+    monkeypatch.setattr(Command, '_storages', lambda self: {'cleanup': (storage, fields)})
+
+    out = StringIO()
+    call_command('sweepmedia', min_age=0, batch_size=1, stdout=out)
+    assert 'cleanup: scanned 3, orphaned 2, deleted 0' in out.getvalue()
+    assert all(storage.exists(name) for name in orphans)
+
+    # Recently modified files are skipped
+    out = StringIO()
+    call_command('sweepmedia', delete=True, stdout=out)
+    assert 'orphaned 0' in out.getvalue()
+
+    state = tmp_path / 'sweep.json'
+    state.write_text(json.dumps({'cleanup': 'a/orphan.txt'}))
+    call_command('sweepmedia', delete=True, min_age=0, state=str(state), stdout=StringIO())
+    assert storage.exists(orphans[0])  # before resume point
+    assert not storage.exists(orphans[1])
+    assert storage.exists(obj.file1.name)
+    assert json.loads(state.read_text()) == {}
+
+
+def test_sweepmedia_groups_fields_by_storage_location(monkeypatch):
+    from django.apps import apps
+
+    from adjango.management.commands import sweepmedia
+
+    labels = ['test_file_cleanup.CleanupDefaultModel', 'test_file_cleanup.SweepStorageModel']
+    monkeypatch.setattr(sweepmedia, 'get_models_list', lambda: iter(labels))
+    # test_file_cleanup is not an installed app
+    monkeypatch.setattr(apps, 'get_model', lambda label: apps.get_registered_model(*label.split('.')))
+
+    storages = sweepmedia.Command()._storages()
+
+    assert {key: [field.name for _, field in fields] for key, (_, fields) in storages.items()} == {
+        'test_file_cleanup.CleanupDefaultModel.file1': ['file1', 'image', 'first', 'second'],
+        'test_file_cleanup.SweepStorageModel.other': ['other'],
+    }
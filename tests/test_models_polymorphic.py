@@ -0,0 +1,161 @@
+import pytest
+from asgiref.sync import sync_to_async
+
+from app.models import Book, Gadget, Product
+
+
+def _create_products() -> list[Product]:
+    return [
+        Book.objects.create(name='b1', price=1, author='a1'),
+        Product.objects.create(name='p', price=2),
+        Gadget.objects.create(name='g', price=3, brand='x'),
+        Book.objects.create(name='b2', price=4, author='a2'),
+    ]
+
+
+@pytest.mark.django_db
+def test_get_real_instances_batches_by_type(django_assert_num_queries):
+    created = _create_products()
+    base = list(Product.objects.non_polymorphic().order_by('pk'))
+    base.append(base[0])
+    Product.get_real_instances(base)  # warm ContentType cache
+
+    with django_assert_num_queries(2):  # Book and Gadget, plain Product needs no query
+        real = Product.get_real_instances(base)
+
+    assert [type(obj) for obj in real] == [Book, Product, Gadget, Book, Book]
+    assert [obj.pk for obj in real] == [obj.pk for obj in created] + [created[0].pk]
+    assert real[1] is base[1]
+    assert real[3].author == 'a2'
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_aget_real_instances():
+    await sync_to_async(_create_products)()
+    base = [p async for p in Product.objects.non_polymorphic().order_by('pk')]
+
+    real = await Product.aget_real_instances(base)
+
+    assert [type(obj) for obj in real] == [Book, Product, Gadget, Book]
+    assert real[0].author == 'a1' and real[2].brand == 'x'
+
+
+@pytest.mark.django_db
+def test_get_real_instances_missing_row():
+    book = Book.objects.create(name='b', price=1, author='a')
+    base = Product(pk=book.pk + 100, polymorphic_ctype_id=book.polymorphic_ctype_id)
+
+    assert Product.get_real_instances([base]) == [None]
+
+
+@pytest.mark.django_db
+def test_ctype_cache_resolves_without_queries(django_assert_num_queries):
+    from django.contrib.contenttypes.models import ContentType
+
+    from adjango.utils.contenttypes import clear_ctype_cache, get_ctype_model, get_ctype_verbose_name
+
+    book = Book.objects.create(name='b', price=1, author='a')
+    base = Product.objects.non_polymorphic().get(pk=book.pk)
+    clear_ctype_cache()
+    ContentType.objects.clear_cache()
+
+    with django_assert_num_queries(1):  # whole table in one query
+        assert get_ctype_model(book.polymorphic_ctype_id) is Book
+    with django_assert_num_queries(0):
+        assert str(get_ctype_verbose_name(book.polymorphic_ctype_id)) == 'book'
+        assert base.get_real_instance_class() is Book
+
+    with pytest.raises(ContentType.DoesNotExist):
+        get_ctype_model(book.polymorphic_ctype_id + 1000)
+
+
+@pytest.mark.django_db
+def test_polymorphic_type_admin_mixin_no_query_per_row(django_assert_num_queries, rf):
+    from django.contrib import admin
+
+    from adjango.mixins.polymorphic import PolymorphicTypeAdminMixin
+    from adjango.utils.contenttypes import clear_ctype_cache
+
+    class ProductAdmin(PolymorphicTypeAdminMixin, admin.ModelAdmin):
+        list_display = ('name',)
+
+    _create_products()
+    clear_ctype_cache()
+    model_admin = ProductAdmin(Product, admin.site)
+    request = rf.get('/')
+
+    with django_assert_num_queries(2):  # ContentTypes warm up and the rows
+        rows = list(model_admin.get_queryset(request).non_polymorphic().order_by('pk'))
+        types = [str(model_admin.type(obj)) for obj in rows]
+
+    assert types == ['book', 'product', 'gadget', 'book']
+    assert model_admin.get_list_display(request) == ('name', 'type')
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_abase_only_single_query():
+    await sync_to_async(_create_products)()
+
+    products = await Product.objects.order_by('pk').abase_only()
+
+    assert [type(obj) for obj in products] == [Product] * 4
+    assert not hasattr(products[0], 'author')  # no lazy upcast by default
+
+
+@pytest.mark.django_db
+def test_abase_only_lazy_upcast(django_assert_num_queries):
+    from asgiref.sync import async_to_sync
+
+    from adjango.utils.contenttypes import warm_ctype_cache
+
+    _create_products()
+    products = async_to_sync(Product.objects.order_by('pk').abase_only)(lazy_upcast=True)
+    warm_ctype_cache()
+
+    with django_assert_num_queries(1):  # both Books in one query
+        assert products[0].author == 'a1'
+        assert products[3].author == 'a2'
+    with django_assert_num_queries(1):
+        assert products[2].brand == 'x'
+    with django_assert_num_queries(0):
+        assert products[1].name == 'p'
+        assert not hasattr(products[1], 'author')
+        assert not hasattr(products[0], 'brand')
+    assert products[0].__class__ is Product
+    assert isinstance(products[0], Product)
+
+
+@pytest.mark.django_db
+def test_lazy_upcast_rows_save_with_model_sender():
+    from asgiref.sync import async_to_sync
+    from django.db.models.signals import post_save
+
+    _create_products()
+    product = async_to_sync(Product.objects.order_by('pk').abase_only)(lazy_upcast=True)[0]
+    senders = []
+
+    def receiver(sender, **kwargs):
+        senders.append(sender)
+
+    post_save.connect(receiver)
+    try:
+        product.name = 'renamed'
+        product.save(update_fields=['name'])
+    finally:
+        post_save.disconnect(receiver)
+
+    assert senders == [Product]
+    assert Book.objects.get(pk=product.pk).name == 'renamed'
+
+
+@pytest.mark.django_db
+def test_missing_one_to_one_raises_does_not_exist():
+    book, product, _, _ = _create_products()
+
+    with pytest.raises(Product.DoesNotExist):
+        Book(name='unsaved', price=1, author='a').product_ptr
+    with pytest.raises(Book.DoesNotExist):
+        Product.objects.non_polymorphic().get(pk=product.pk).book
+    assert Product.objects.non_polymorphic().get(pk=book.pk).book == book
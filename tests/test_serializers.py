@@ -5,7 +5,7 @@ import pytest
 
 try:
     from django.contrib.auth.models import User
-    from rest_framework.serializers import BaseSerializer, CharField, IntegerField
+    from rest_framework.serializers import BaseSerializer, CharField, IntegerField, SerializerMethodField
 
     DRF_AVAILABLE = True
 except ImportError:
@@ -15,6 +15,8 @@ from django.db import models
 
 from adjango.aserializers import AModelSerializer
 from adjango.serializers import dynamic_serializer
+from app.models import Book, Order, Product
+from app.models import User as AppUser
 
 
 # Simple test model to avoid issues with User
@@ -26,6 +28,43 @@ class TestModel(models.Model):
         app_label = 'test_app'
 
 
+class AppUserSerializer(AModelSerializer):
+    class Meta:
+        model = AppUser
+        fields = ('id', 'username')
+
+
+class ProductSerializer(AModelSerializer):
+    class Meta:
+        model = Product
+        fields = '__all__'
+
+
+class ProductListSerializer(AModelSerializer):
+    class Meta:
+        model = Product
+        fields = ('id', 'name', 'price')
+
+
+class BookSerializer(AModelSerializer):
+    class Meta:
+        model = Book
+        fields = ('author',)
+
+
+class OrderSerializer(AModelSerializer):
+    user = AppUserSerializer(read_only=True)
+    products = ProductSerializer(many=True, read_only=True)
+    label = SerializerMethodField()
+
+    class Meta:
+        model = Order
+        fields = '__all__'
+
+    def get_label(self, obj):
+        return f'Order {obj.pk}'
+
+
 @pytest.mark.skipif(not DRF_AVAILABLE, reason='Django REST Framework not available')
 class TestDynamicSerializer:
     """Tests for dynamic_serializer function"""
@@ -103,7 +142,8 @@ class TestDynamicSerializer:
         # Check that field is overridden
         instance = DynamicTestSerializer()
         assert "email" in instance.fields
-        assert instance.fields["email"] is custom_instance
+        assert isinstance(instance.fields["email"], CustomFieldSerializer)
+        assert instance.fields["email"] is not custom_instance
         assert instance.fields["email"].read_only is False
 
     def test_dynamic_serializer_invalid_field_override(self):
@@ -234,7 +274,8 @@ class TestDynamicSerializer:
         # Check overrides
         instance = DynamicTestSerializer()
         assert isinstance(instance.fields["username"], CustomSerializer1)
-        assert instance.fields["first_name"] is custom_instance
+        assert isinstance(instance.fields["first_name"], CustomSerializer2)
+        assert instance.fields["first_name"] is not custom_instance
         # email should remain original - it's EmailField from User model
         assert "email" in instance.fields
 
@@ -272,6 +313,163 @@ class TestDynamicSerializer:
         # Check class name
         assert DynamicTestSerializer.__name__ == "DynamicSerializer"
 
+    def test_dynamic_serializer_cached(self):
+        """Test that repeated calls return the same class"""
+
+        class BaseTestSerializer(AModelSerializer):
+            class Meta:
+                model = User
+                fields = ("username", "email", "first_name")
+
+        first = dynamic_serializer(BaseTestSerializer, ("username", "email"))
+        second = dynamic_serializer(BaseTestSerializer, ("username", "email"))
+        other = dynamic_serializer(BaseTestSerializer, ("username",))
+
+        assert first is second
+        assert first is not other
+
+    def test_dynamic_serializer_cache_keyed_by_override_identity(self):
+        """Test that overrides are part of the cache key by identity"""
+
+        class BaseTestSerializer(AModelSerializer):
+            class Meta:
+                model = User
+                fields = ("username", "email")
+
+        class CustomFieldSerializer(BaseSerializer):
+            pass
+
+        override = CustomFieldSerializer()
+
+        first = dynamic_serializer(BaseTestSerializer, ("username", "email"), {"email": override})
+        second = dynamic_serializer(BaseTestSerializer, ("username", "email"), {"email": override})
+        other = dynamic_serializer(BaseTestSerializer, ("username", "email"), {"email": CustomFieldSerializer()})
+        by_class = dynamic_serializer(BaseTestSerializer, ("username", "email"), {"email": CustomFieldSerializer})
+
+        assert first is second
+        assert first is not other
+        assert by_class is dynamic_serializer(
+            BaseTestSerializer, ("username", "email"), {"email": CustomFieldSerializer}
+        )
+        assert isinstance(first().fields["email"], CustomFieldSerializer)
+
+    def test_dynamic_serializer_cached_class_instantiated_twice(self):
+        """Test that every instance of memoized class binds its own copy of override instance"""
+
+        class BaseTestSerializer(AModelSerializer):
+            class Meta:
+                model = User
+                fields = ("username", "email")
+
+        class CustomFieldSerializer(BaseSerializer):
+            pass
+
+        override = CustomFieldSerializer(read_only=True)
+
+        first = dynamic_serializer(BaseTestSerializer, ("username", "email"), {"email": override})()
+        second = dynamic_serializer(BaseTestSerializer, ("username", "email"), {"email": override})()
+
+        assert first.fields["email"] is not second.fields["email"]
+        assert first.fields["email"].parent is first
+        assert second.fields["email"].parent is second
+
+
+@pytest.mark.skipif(not DRF_AVAILABLE, reason='Django REST Framework not available')
+class TestDynamicSerializerOptimizeQueryset:
+    """Tests for optimize_queryset of dynamic serializers"""
+
+    def test_only_and_select_related(self):
+        """Test concrete fields go to only() and forward relations to select_related()"""
+        Narrow = dynamic_serializer(OrderSerializer, ('id', 'user'))
+
+        queryset = Narrow.optimize_queryset(Order.objects.all())
+
+        assert queryset.query.deferred_loading == (frozenset({'id', 'user'}), False)
+        assert queryset.query.select_related == {'user': {}}
+
+    def test_primary_key_relation_not_joined(self):
+        """Test that relations rendered as primary keys only load the column"""
+
+        class OrderPkSerializer(AModelSerializer):
+            class Meta:
+                model = Order
+                fields = '__all__'
+
+        Narrow = dynamic_serializer(OrderPkSerializer, ('id', 'user'))
+
+        queryset = Narrow.optimize_queryset(Order.objects.all())
+
+        assert queryset.query.deferred_loading == (frozenset({'id', 'user'}), False)
+        assert queryset.query.select_related is False
+        assert 'JOIN' not in str(queryset.query)
+
+    def test_method_field_disables_only(self):
+        """Test that fields not mapped to columns keep all columns loaded"""
+        Narrow = dynamic_serializer(OrderSerializer, ('id', 'label', 'products'))
+
+        queryset = Narrow.optimize_queryset(Order.objects.all())
+
+        assert queryset.query.deferred_loading == (frozenset(), True)
+        assert queryset._prefetch_related_lookups == ('products',)
+
+    def test_nested_dynamic_prefetch(self):
+        """Test that nested dynamic serializer builds the prefetch queryset"""
+        from django.db.models import Prefetch
+
+        ProductNarrow = dynamic_serializer(ProductSerializer, ('id', 'name'))
+        Narrow = dynamic_serializer(OrderSerializer, ('id', 'products'), {'products': ProductNarrow(many=True)})
+
+        queryset = Narrow.optimize_queryset(Order.objects.all())
+
+        (lookup,) = queryset._prefetch_related_lookups
+        assert isinstance(lookup, Prefetch)
+        assert lookup.prefetch_through == 'products'
+        assert lookup.queryset.model is Product
+        # Product is polymorphic, so the nested queryset is not narrowed by only()
+        assert lookup.queryset.query.deferred_loading == (frozenset(), True)
+
+    @pytest.mark.django_db
+    def test_polymorphic_queryset_not_narrowed(self, django_assert_num_queries):
+        """Test that upcast rows don't load deferred subclass columns one by one"""
+        for i in range(5):
+            Book.objects.create(name=f'b{i}', price=1, author=f'a{i}')
+        Narrow = dynamic_serializer(ProductListSerializer, ('id', 'name'))
+
+        queryset = Narrow.optimize_queryset(Product.objects.all())
+        list(Product.objects.all())  # warm ContentType caches
+
+        assert queryset.query.deferred_loading == (frozenset(), True)
+        with django_assert_num_queries(2):
+            assert len(Narrow(queryset, many=True).data) == 5
+        assert Narrow.optimize_queryset(Product.objects.non_polymorphic()).query.deferred_loading[1] is False
+
+    @pytest.mark.django_db
+    def test_nested_reverse_one_to_one(self, django_assert_num_queries):
+        """Test that joined reverse one-to-one relation is not deferred"""
+        Book.objects.create(name='b', price=1, author='a')
+        Narrow = dynamic_serializer(ProductListSerializer, ('id', 'name', 'book'), {'book': BookSerializer})
+
+        queryset = Narrow.optimize_queryset(Product.objects.non_polymorphic())
+
+        assert queryset.query.select_related == {'book': {}}
+        with django_assert_num_queries(1):
+            assert Narrow(queryset, many=True).data[0]['book'] == {'author': 'a'}
+
+    @pytest.mark.django_db
+    def test_optimized_serialization_queries(self, django_assert_num_queries):
+        """Test that optimized queryset serializes without per-row queries"""
+        Narrow = dynamic_serializer(OrderSerializer, ('id', 'user', 'products'))
+        for i in range(3):
+            user = AppUser.objects.create(username=f'opt{i}', phone=f'opt{i}')
+            order = Order.objects.create(user=user)
+            order.products.add(Product.objects.create(name=f'p{i}', price=1))
+
+        with django_assert_num_queries(2):
+            data = Narrow(Narrow.optimize_queryset(Order.objects.all()), many=True).data
+
+        assert len(data) == 3
+        assert data[0]['user']['username'] == 'opt0'
+
 
 @pytest.mark.skipif(DRF_AVAILABLE, reason="Skip when DRF is available")
 class TestWithoutDRF:
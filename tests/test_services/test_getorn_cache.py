@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+from django.core.cache import cache
+from django.db.models import QuerySet
+
+from adjango.services.base import BaseService
+from adjango.services.cache import CachePolicy
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def aget_calls(monkeypatch):
+    calls = []
+    original = QuerySet.aget
+
+    async def aget(self, *args, **kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(0.01)
+        return await original(self, *args, **kwargs)
+
+    monkeypatch.setattr(QuerySet, 'aget', aget)
+    return calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_agetorn_cache_reads_through(aget_calls):
+    from app.models import Post, Role
+
+    post = await Post.objects.acreate(title='a', content='c', image='i')
+    role = await Role.objects.acreate(name=Role.Variant.ORGANIZER)
+
+    first = await BaseService.agetorn(Post.objects, pk=post.pk, cache=60)
+    second = await BaseService.agetorn(Post.objects.all(), id=post.pk, cache=CachePolicy(timeout=60))
+    assert second == first and second.title == 'a'
+    assert len(aget_calls) == 1
+
+    by_name = await BaseService.agetorn(Role.objects, name=Role.Variant.ORGANIZER, cache=60)
+    assert await BaseService.agetorn(Role.objects, name=Role.Variant.ORGANIZER, cache=60) == by_name
+    assert await BaseService.agetorn(Role.objects, pk=role.pk, cache=60) == by_name
+    assert len(aget_calls) == 2
+
+    # Misses are not cached, non pk/unique lookups and calls without cache= bypass it
+    assert await BaseService.agetorn(Post.objects, pk=post.pk + 100, cache=60) is None
+    assert await BaseService.agetorn(Post.objects, pk=post.pk + 100, cache=60) is None
+    await BaseService.agetorn(Post.objects, title='a', cache=60)
+    await BaseService.agetorn(Post.objects, pk=post.pk)
+    assert len(aget_calls) == 6
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_agetorn_cache_invalidated_on_save_and_delete():
+    from app.models import Post
+
+    post = await Post.objects.acreate(title='a', content='c', image='i')
+    await BaseService.agetorn(Post.objects, pk=post.pk, cache=60)
+
+    post.title = 'b'
+    await post.asave()
+    assert (await BaseService.agetorn(Post.objects, pk=post.pk, cache=60)).title == 'b'
+
+    await Post.objects.filter(pk=post.pk).adelete()
+    assert await BaseService.agetorn(Post.objects, pk=post.pk, cache=60) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_agetorn_cache_single_flight(aget_calls):
+    from app.models import Post
+
+    post = await Post.objects.acreate(title='a', content='c', image='i')
+
+    results = await asyncio.gather(*(BaseService.agetorn(Post.objects, pk=post.pk, cache=60) for _ in range(5)))
+
+    assert len(aget_calls) == 1
+    assert all(obj == post for obj in results)
+    assert len({id(obj) for obj in results}) == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_agetorn_cache_keeps_lock_of_other_process(aget_calls):
+    from adjango.services.cache import _key
+    from app.models import Post
+
+    post = await Post.objects.acreate(title='a', content='c', image='i')
+    lock_key = _key('app.post', 'id', post.pk) + ':lock'
+    await cache.aset(lock_key, 1, 60)
+
+    # Waits for the lock holder, then loads itself without releasing its lock
+    assert await BaseService.agetorn(Post.objects, pk=post.pk, cache=CachePolicy(timeout=60, lock_timeout=0.1)) == post
+    assert len(aget_calls) == 1
+    assert await cache.aget(lock_key) == 1
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return 'replica'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_agetorn_cache_invalidated_with_read_replica_router(settings):
+    from adjango.services.base import IdentityMap
+    from adjango.services.cache import acached_get
+    from app.models import Post
+
+    post = await Post.objects.acreate(title='a', content='c', image='i')
+    settings.DATABASE_ROUTERS = [ReplicaRouter()]
+    queryset = Post.objects.all()
+    lookup_key = IdentityMap.lookup_key(queryset, (), {'pk': post.pk})
+    assert lookup_key[1] == 'replica'
+    fetches = []
+
+    async def fetch():
+        # The test database has no replica, read the primary instead
+        fetches.append(post.pk)
+        return await Post.objects.using('default').aget(pk=post.pk)
+
+    assert (await acached_get(queryset, lookup_key, 60, fetch)).title == 'a'
+    assert (await acached_get(queryset, lookup_key, 60, fetch)).title == 'a'
+    assert len(fetches) == 1
+
+    # Saved through the write alias
+    post.title = 'b'
+    await post.asave()
+    assert (await acached_get(queryset, lookup_key, 60, fetch)).title == 'b'
+    assert len(fetches) == 2
@@ -0,0 +1,154 @@
+import pytest
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from adjango.middleware import IdentityMapMiddleware
+from adjango.services.base import BaseService, IdentityMap
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_agetorn_without_scope_hits_database():
+    from app.models import Post
+
+    post = await Post.objects.acreate(title='a', content='c', image='i')
+
+    first = await BaseService.agetorn(Post.objects, pk=post.pk)
+    second = await BaseService.agetorn(Post.objects, pk=post.pk)
+
+    assert first == second and first is not second
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_agetorn_identity_map():
+    from app.models import Post, Role
+
+    post = await Post.objects.acreate(title='a', content='c', image='i')
+    role = await Role.objects.acreate(name=Role.Variant.ORGANIZER)
+
+    with IdentityMap.scope():
+        first = await BaseService.agetorn(Post.objects, pk=post.pk)
+        assert await BaseService.agetorn(Post.objects.all(), id=str(post.pk)) is first
+        assert await sync_to_async(BaseService.getorn)(Post.objects, None, id__exact=post.pk) is first
+
+        # Unique lookups are cached and also fill the pk entry
+        by_name = await BaseService.agetorn(Role.objects, name=Role.Variant.ORGANIZER)
+        assert await BaseService.agetorn(Role.objects, pk=role.pk) is by_name
+
+        # Filtered querysets and non-unique lookups always query
+        assert await BaseService.agetorn(Post.objects.filter(title='a'), pk=post.pk) is not first
+        assert await BaseService.agetorn(Post.objects, title='a') is not first
+        assert await BaseService.agetorn(Post.objects, pk=post.pk + 100) is None
+
+    assert IdentityMap.current() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_identity_map_invalidated_on_save_and_delete():
+    from app.models import Post
+
+    post = await Post.objects.acreate(title='a', content='c', image='i')
+
+    with IdentityMap.scope():
+        first = await BaseService.agetorn(Post.objects, pk=post.pk)
+
+        post.title = 'b'
+        await post.asave()
+        fresh = await BaseService.agetorn(Post.objects, pk=post.pk)
+        assert fresh is not first and fresh.title == 'b'
+
+        await fresh.adelete()
+        assert await BaseService.agetorn(Post.objects, pk=post.pk) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_identity_map_multi_table_inheritance_pk():
+    from app.models import Book
+
+    book = await Book.objects.acreate(name='b', price=1, author='a')
+
+    with IdentityMap.scope():
+        first = await BaseService.agetorn(Book.objects, pk=book.pk)
+        assert await BaseService.agetorn(Book.objects, product_ptr_id=book.pk) is first
+
+        book.author = 'c'
+        await book.asave()
+        assert (await BaseService.agetorn(Book.objects, pk=book.pk)).author == 'c'
+
+
+def test_lookup_key_skips_non_model_and_locking_querysets():
+    from app.models import Book, Order, Post, Product
+
+    assert IdentityMap.lookup_key(Post.objects, (), {'pk': 1}) is not None
+    assert IdentityMap.lookup_key(Book.objects, (), {'pk': 1})[2] == 'product_ptr_id'
+    assert IdentityMap.lookup_key(Order.objects, (), {'user': 1}) is None
+    assert IdentityMap.lookup_key(Product.objects, (), {'pk': 1}) is not None
+    assert IdentityMap.lookup_key(Post.objects.select_for_update(), (), {'pk': 1}) is None
+    assert IdentityMap.lookup_key(Post.objects.values(), (), {'pk': 1}) is None
+    assert IdentityMap.lookup_key(Post.objects.values_list('title'), (), {'pk': 1}) is None
+    assert IdentityMap.lookup_key(Product.objects.non_polymorphic(), (), {'pk': 1}) is None
+
+
+@pytest.mark.django_db
+def test_identity_map_middleware_sync():
+    seen = []
+
+    def view(request):
+        seen.append(IdentityMap.current())
+        return HttpResponse('ok')
+
+    middleware = IdentityMapMiddleware(view)
+    middleware(RequestFactory().get('/'))
+    middleware(RequestFactory().get('/'))
+
+    assert all(isinstance(m, IdentityMap) for m in seen)
+    assert seen[0] is not seen[1]
+    assert IdentityMap.current() is None
+
+
+@pytest.mark.asyncio
+async def test_identity_map_middleware_async():
+    seen = []
+
+    async def view(request):
+        seen.append(IdentityMap.current())
+        return HttpResponse('ok')
+
+    middleware = IdentityMapMiddleware(view)
+    response = await middleware(RequestFactory().get('/'))
+
+    assert response.status_code == 200
+    assert isinstance(seen[0], IdentityMap)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_agetorn_many():
+    from app.models import Post, Role
+
+    first = await Post.objects.acreate(title='a', content='c', image='i')
+    second = await Post.objects.acreate(title='b', content='c', image='i')
+    missing = second.pk + 100
+
+    posts = await BaseService.agetorn_many(Post.objects, values=[second.pk, str(first.pk), missing, second.pk])
+    assert list(posts) == [second.pk, str(first.pk), missing]
+    assert posts[second.pk] == second and posts[str(first.pk)] == first and posts[missing] is None
+
+    role = await Role.objects.acreate(name=Role.Variant.ORGANIZER)
+    roles = await Role.objects.agetorn_many('name', [Role.Variant.ORGANIZER])
+    assert roles == {Role.Variant.ORGANIZER: role}
+
+    with pytest.raises(ValueError):
+        await BaseService.agetorn_many(Post.objects, values=[first.pk, missing], exception=ValueError)
+    with pytest.raises(Post.MultipleObjectsReturned):
+        await BaseService.agetorn_many(Post.objects, 'content', ['c'])
+
+    with IdentityMap.scope():
+        cached = await BaseService.agetorn(Post.objects, pk=first.pk)
+        posts = await BaseService.agetorn_many(Post.objects, values=[first.pk, second.pk])
+        assert posts[first.pk] is cached
+        assert await BaseService.agetorn(Post.objects, pk=second.pk) is posts[second.pk]
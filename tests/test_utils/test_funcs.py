@@ -3,7 +3,17 @@ from django.http import HttpResponse
 from django.test import RequestFactory
 
 from adjango.services.base import BaseService
-from adjango.utils.funcs import aadd, aall, afilter, arelated, aset, auser_passes_test
+from adjango.utils.funcs import (
+    aadd,
+    aall,
+    afilter,
+    aiter_chunks,
+    akeyset_page,
+    arelated,
+    arelated_many,
+    aset,
+    auser_passes_test,
+)
 
 
 @pytest.mark.asyncio
@@ -69,6 +79,127 @@ async def test_arelated_aset_aadd_aall_afilter():
     assert related_user == user
 
 
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_aiter_chunks():
+    from app.models import Post
+
+    for i in range(5):
+        await Post.objects.acreate(title=f't{i}', content='c', image='i')
+
+    chunks = [chunk async for chunk in aiter_chunks(Post.objects.order_by('id'), 2)]
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [p.title for chunk in chunks for p in chunk] == [f't{i}' for i in range(5)]
+
+    assert sum([len(chunk) async for chunk in aiter_chunks(Post.objects)]) == 5
+
+    async for chunk in aiter_chunks(Post.objects.all(), 1):
+        break
+    assert [chunk async for chunk in aiter_chunks(Post.objects.filter(title='missing'))] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_akeyset_page():
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    from app.models import Product
+
+    now = timezone.now()
+    for i in range(5):
+        product = await Product.objects.acreate(name=f'k{i}', price=1)
+        # Two products share created_at, so pk breaks the tie
+        await Product.objects.filter(pk=product.pk).aupdate(created_at=now + timedelta(microseconds=i // 2))
+
+    expected = [p.name async for p in Product.objects.order_by('created_at', 'pk')]
+    for ordering, names in ((('created_at',), expected), (('-created_at', '-pk'), expected[::-1])):
+        collected, cursor, pages = [], None, 0
+        while True:
+            page, cursor = await akeyset_page(Product.objects, ordering, cursor, page_size=2)
+            collected += [p.name for p in page]
+            pages += 1
+            if cursor is None:
+                break
+        assert collected == names
+        assert pages == 3
+
+    with pytest.raises(ValueError):
+        await akeyset_page(Product.objects, cursor='not-a-cursor')
+
+
+def test_keyset_filter_leading_range_bound():
+    from adjango.utils.funcs import _keyset_filter
+
+    assert _keyset_filter(('created_at', 'pk'), [1, 2]).children[0] == ('created_at__gte', 1)
+    assert _keyset_filter(('-created_at', '-pk'), [1, 2]).children[0] == ('created_at__lte', 1)
+    assert _keyset_filter(('pk',), [1]).children == [('pk__gt', 1)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_arelated_batches_concurrent_calls(monkeypatch):
+    import asyncio
+
+    from adjango.utils.funcs import RelatedLoader
+    from app.models import Order, User
+
+    users = [await User.objects.acreate(username=f'rl{i}', phone=f'rl{i}') for i in range(3)]
+    for user in users + users[:1]:
+        await Order.objects.acreate(user=user)
+    orders = [o async for o in Order.objects.order_by('pk')]
+
+    calls = []
+    fetch = RelatedLoader._fetch
+    monkeypatch.setattr(
+        RelatedLoader, '_fetch', staticmethod(lambda *args: calls.append(args[2]) or fetch(*args))
+    )
+
+    result = await asyncio.gather(*(o.arelated('user') for o in orders))
+
+    assert result == users + users[:1]
+    assert len(calls) == 1 and sorted(calls[0]) == sorted(u.pk for u in users)
+    assert all(Order.user.is_cached(o) for o in orders)
+
+    # Cached values are returned without another query
+    assert await arelated(orders[0], 'user') == users[0]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_arelated_batched_missing_object():
+    from app.models import Order, User
+
+    user = await User.objects.acreate(username='rlm', phone='rlm')
+    order = await Order.objects.acreate(user=user)
+    order = await Order.objects.aget(pk=order.pk)
+    order.user_id = user.pk + 1000
+
+    with pytest.raises(User.DoesNotExist):
+        await arelated(order, 'user')
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_arelated_many():
+    from app.models import Order, Product, User
+
+    user = await User.objects.acreate(username='rm', phone='rm')
+    product = await Product.objects.acreate(name='rm', price=1)
+    for _ in range(2):
+        order = await Order.objects.acreate(user=user)
+        await aadd(order.products, product)
+
+    orders = await arelated_many(await aall(Order.objects), 'user', 'products')
+
+    # Related objects are available without queries from async code
+    assert [o.user for o in orders] == [user, user]
+    assert [list(o.products.all()) for o in orders] == [[product], [product]]
+    assert await arelated_many([], 'user') == []
+
+
 @pytest.mark.asyncio
 @pytest.mark.django_db
 async def test_arelated_errors():
@@ -85,6 +216,7 @@ async def test_arelated_errors():
     order_fresh = await Order.objects.aget(pk=order.pk)
     related = await arelated(order_fresh, 'user')
     assert related == user
+    assert await arelated(order_fresh, 'user_id') == user.pk
 
 
 @pytest.mark.asyncio